@@ -9,11 +9,14 @@ propagation paths.
 
 import json
 import re
+import sys
 import uuid
-from collections import deque
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Optional, Union
 
 from .models import Fix
 from .storage import FixRepository
@@ -152,8 +155,11 @@ ATTR_CHECKS = {
 # Data structures
 # ---------------------------------------------------------------------------
 
+# __slots__ drops the per-instance __dict__; dataclass(slots=) needs 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ImpactNode:
     """A resource node in the change impact graph."""
 
@@ -170,7 +176,7 @@ class ImpactNode:
     change_fingerprint: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AffectedResource:
     """A resource reached by BFS propagation from a control point."""
 
@@ -180,7 +186,7 @@ class AffectedResource:
     path: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ImpactResult:
     """Complete result of a change impact analysis."""
 
@@ -223,22 +229,44 @@ def is_actionable_change(node: ImpactNode) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _build_prefix_trie(patterns: dict[str, tuple[str, float]]) -> dict:
+    """Build a character trie over pattern prefixes.
+
+    Each node is a dict of child characters; terminal nodes carry their
+    (category, criticality) payload under the None key.
+    """
+    root: dict = {}
+    for prefix, payload in patterns.items():
+        node = root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node[None] = payload
+    return root
+
+
+_CONTROL_POINT_TRIE = _build_prefix_trie(CONTROL_POINT_PATTERNS)
+
+
+@lru_cache(maxsize=1024)
 def classify_control_point(resource_type: str) -> Optional[tuple[str, float]]:
     """Classify a resource type as a control point.
 
     Uses prefix matching so e.g. 'google_project_iam_member' matches
-    'google_project_iam'.
+    'google_project_iam'. Walks a prefix trie built at import time, so the
+    cost is bounded by the length of resource_type rather than the number
+    of patterns. Memoized because a plan repeats a handful of resource
+    types across all of its nodes.
 
     Returns (category, criticality) or None if not a control point.
     """
-    rt_lower = resource_type.lower()
-    # Try longest prefix first so more specific patterns win
+    # The deepest terminal reached is the longest, most specific prefix
     best_match = None
-    best_len = 0
-    for prefix, (category, criticality) in CONTROL_POINT_PATTERNS.items():
-        if rt_lower.startswith(prefix) and len(prefix) > best_len:
-            best_match = (category, criticality)
-            best_len = len(prefix)
+    node = _CONTROL_POINT_TRIE
+    for ch in resource_type.lower():
+        node = node.get(ch)
+        if node is None:
+            break
+        best_match = node.get(None, best_match)
     return best_match
 
 
@@ -247,6 +275,15 @@ def is_boundary_resource(resource_type: str) -> bool:
     return classify_control_point(resource_type) is not None
 
 
+def _is_boundary_node(node: ImpactNode) -> bool:
+    """Check if an ImpactNode is a boundary resource.
+
+    Trusts is_control_point when analyze_change_impact already set it, and
+    only falls back to classifying the resource type otherwise.
+    """
+    return node.is_control_point or is_boundary_resource(node.resource_type)
+
+
 # ---------------------------------------------------------------------------
 # DOT graph parser
 # ---------------------------------------------------------------------------
@@ -259,67 +296,117 @@ _EDGE_RE = re.compile(
 )
 
 
+@lru_cache(maxsize=8192)
 def _normalize_tf_node(name: str) -> str:
     """Normalize a Terraform graph node name to match plan addresses.
 
-    Strips '[root] ' prefix and '(expand)'/'(close)' suffixes.
+    Strips '[root] ' prefix and '(expand)'/'(close)' suffixes. Memoized
+    because every node name recurs across many edges.
     """
-    name = name.strip()
-    if name.startswith("[root] "):
-        name = name[7:]
-    name = re.sub(r"\s*\(expand\)\s*$", "", name)
-    name = re.sub(r"\s*\(close\)\s*$", "", name)
+    name = name.strip().removeprefix("[root] ")
+    for suffix in ("(expand)", "(close)"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)].rstrip()
     return name.strip()
 
 
-def parse_dot_graph(dot_text: str) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
-    """Parse a Terraform DOT graph into forward and reverse adjacency lists.
+# Lines starting with these never contribute edges
+_DOT_SKIP_PREFIXES = ("//", "#", "subgraph", "digraph")
 
-    Returns (forward_adj, reverse_adj) where forward means A -> B
-    (A depends on B or B is downstream of A, depending on TF graph direction).
+
+def _is_simple_dot_id(token: str) -> bool:
+    """Return True for a bare `"quoted"` or unquoted DOT node ID."""
+    if len(token) > 2 and token[0] == '"' and token[-1] == '"':
+        return '"' not in token[1:-1]
+    return bool(token) and '"' not in token and not any(c.isspace() for c in token)
+
+
+def _split_dot_edge(line: str) -> Optional[tuple[str, str]]:
+    """Split an edge line into raw (src, dst) names without the regex engine.
+
+    Handles the `"a" -> "b"` and `a -> b` shapes Terraform emits. Returns
+    None for anything else (attributes, odd spacing) so the caller can fall
+    back to _EDGE_RE.
     """
-    forward: dict[str, set[str]] = {}
-    reverse: dict[str, set[str]] = {}
+    src, sep, dst = line.partition(" -> ")
+    if not sep:
+        return None
+    src = src.rstrip()
+    dst = dst.rstrip(";").strip()
+    if _is_simple_dot_id(src) and _is_simple_dot_id(dst):
+        return src.strip('"'), dst.strip('"')
+    return None
+
 
+def _iter_dot_edges(dot_text: str) -> Iterator[tuple[str, str]]:
+    """Yield normalized (src, dst) pairs for every edge in a DOT graph."""
     for line in dot_text.splitlines():
+        # Node declarations, braces and blank lines never carry an edge;
+        # reject them before paying for strip() or the regex
+        if "->" not in line:
+            continue
         stripped = line.strip()
-        # Skip comments, subgraph declarations, closing braces
-        if (
-            stripped.startswith("//")
-            or stripped.startswith("#")
-            or stripped.startswith("subgraph")
-            or stripped.startswith("digraph")
-            or stripped in ("}", "{")
-        ):
+        # Skip comments, subgraph declarations
+        if stripped.startswith(_DOT_SKIP_PREFIXES):
             continue
 
-        m = _EDGE_RE.search(stripped)
-        if m:
+        edge = _split_dot_edge(stripped)
+        if edge is None:
+            m = _EDGE_RE.search(stripped)
+            if not m:
+                continue
             if m.group(1) is not None:
-                src = _normalize_tf_node(m.group(1))
-                dst = _normalize_tf_node(m.group(2))
+                edge = (m.group(1), m.group(2))
             else:
-                src = _normalize_tf_node(m.group(3))
-                dst = _normalize_tf_node(m.group(4))
+                edge = (m.group(3), m.group(4))
+
+        yield _normalize_tf_node(edge[0]), _normalize_tf_node(edge[1])
+
+
+def parse_dot_graph(dot_text: str) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+    """Parse a Terraform DOT graph into forward and reverse adjacency lists.
 
-            forward.setdefault(src, set()).add(dst)
-            forward.setdefault(dst, set())
-            reverse.setdefault(dst, set()).add(src)
-            reverse.setdefault(src, set())
+    Returns (forward_adj, reverse_adj) where forward means A -> B
+    (A depends on B or B is downstream of A, depending on TF graph direction).
+    """
+    forward: dict[str, set[str]] = {}
+    reverse: dict[str, set[str]] = {}
+
+    # Look keys up before inserting: setdefault(key, set()) would build a
+    # throwaway set for every edge whose endpoints were already seen
+    for src, dst in _iter_dot_edges(dot_text):
+        targets = forward.get(src)
+        if targets is None:
+            targets = forward[src] = set()
+        targets.add(dst)
+        if dst not in forward:
+            forward[dst] = set()
+
+        sources = reverse.get(dst)
+        if sources is None:
+            sources = reverse[dst] = set()
+        sources.add(src)
+        if src not in reverse:
+            reverse[src] = set()
 
     return forward, reverse
 
 
-def _addr_in_plan(addr: str, changed_addresses: set) -> bool:
-    """Return True if addr is in the plan, including as the base name of indexed resources.
+def _plan_address_keys(changed_addresses: set) -> set[str]:
+    """Return every address that counts as "in the plan" for a set of changes.
 
     terraform graph collapses count/for_each instances like aws_sg.bulk[0..49]
     into a single node aws_sg.bulk — this must be recognised as "in the plan".
+    Besides the addresses themselves, the result holds each prefix that ends
+    just before a "[", so that check is a set lookup instead of a scan.
     """
-    if addr in changed_addresses:
-        return True
-    prefix = addr + "["
-    return any(a.startswith(prefix) for a in changed_addresses)
+    keys = set(changed_addresses)
+    for addr in changed_addresses:
+        start = addr.find("[")
+        while start != -1:
+            keys.add(addr[:start])
+            start = addr.find("[", start + 1)
+    return keys
 
 
 # ---------------------------------------------------------------------------
@@ -327,71 +414,208 @@ def _addr_in_plan(addr: str, changed_addresses: set) -> bool:
 # ---------------------------------------------------------------------------
 
 
+class _CsrGraph(NamedTuple):
+    """Compressed sparse row view of an adjacency mapping.
+
+    Node names are interned to ints; the neighbors of node i are
+    indices[indptr[i]:indptr[i + 1]]. Both columns are typed int arrays,
+    so each edge of the finished graph costs four bytes instead of a set
+    entry.
+    """
+
+    names: list[str]
+    ids: dict[str, int]
+    indptr: array
+    indices: array
+
+
+def _to_csr(adjacency: dict[str, set[str]]) -> _CsrGraph:
+    """Convert a dict-of-sets adjacency into a _CsrGraph.
+
+    Adjacency keys get the first ids; neighbors that are not keys are
+    appended after them with no outgoing edges.
+    """
+    names = list(adjacency)
+    ids = {name: i for i, name in enumerate(names)}
+    indptr = array("i", [0])
+    indices = array("i")
+
+    for neighbors in adjacency.values():
+        for neighbor in neighbors:
+            nid = ids.get(neighbor)
+            if nid is None:
+                nid = ids[neighbor] = len(names)
+                names.append(neighbor)
+            indices.append(nid)
+        indptr.append(len(indices))
+    indptr.extend([len(indices)] * (len(names) - len(adjacency)))
+
+    return _CsrGraph(names, ids, indptr, indices)
+
+
+def _parse_dot_impact_graph(
+    dot_text: str,
+    seed_sources: set[str],
+) -> tuple[_CsrGraph, dict[str, list[str]]]:
+    """Parse a DOT graph straight into the shape the impact analysis needs.
+
+    Builds the reverse-direction CSR graph used for BFS in the same pass
+    that reads the edges, instead of filling forward and reverse
+    dict-of-sets and converting afterwards. Forward neighbors are only
+    kept for addresses in seed_sources (the changed control points).
+
+    Returns (reverse_graph, forward_neighbors).
+    """
+    names: list[str] = []
+    ids: dict[str, int] = {}
+    in_edges: list[list[int]] = []  # node id -> ids of nodes pointing at it
+    forward_neighbors: dict[str, list[str]] = {}
+
+    def intern(name: str) -> int:
+        nid = ids.get(name)
+        if nid is None:
+            nid = ids[name] = len(names)
+            names.append(name)
+            in_edges.append([])
+        return nid
+
+    for src, dst in _iter_dot_edges(dot_text):
+        src_id = intern(src)
+        in_edges[intern(dst)].append(src_id)
+        if src in seed_sources:
+            forward_neighbors.setdefault(src, []).append(dst)
+
+    # Repeated edges are dropped per node while the CSR is filled, keeping
+    # first-seen order, so no set of every edge is held during parsing
+    indptr = array("i", [0])
+    indices = array("i")
+    for sources in in_edges:
+        indices.extend(dict.fromkeys(sources) if len(sources) > 1 else sources)
+        indptr.append(len(indices))
+    for src, dsts in forward_neighbors.items():
+        forward_neighbors[src] = list(dict.fromkeys(dsts))
+
+    return _CsrGraph(names, ids, indptr, indices), forward_neighbors
+
+
+def _reconstruct_path(node: int, parent: array, names: list[str]) -> list[str]:
+    """Walk parent pointers back to a start node and return the address path."""
+    path = []
+    while node >= 0:
+        path.append(names[node])
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def _bfs_csr(
+    graph: _CsrGraph,
+    start_nodes: list[str],
+    max_depth: int,
+) -> tuple[list[int], array, array]:
+    """Bounded multi-source BFS over a _CsrGraph.
+
+    All start nodes are seeded at depth 0 before the first level, so the
+    whole traversal is one pass however many starts there are. Level
+    order means the first time a node is reached is at its minimum depth
+    over every start. The parent chain from that visit leads back to the
+    nearest start, so no later update is needed.
+
+    Returns (discovered, depth, parent): the ids reached from the starts in
+    visit order (start nodes excluded), plus per-id depth and parent
+    pointers. Paths are left for the caller to rebuild with
+    _reconstruct_path, only for the nodes it keeps. Membership is a
+    bytearray flag per id, so the per-edge check is a byte read.
+    """
+    indptr, indices = graph.indptr, graph.indices
+    n_nodes = len(graph.names)
+    visited = bytearray(n_nodes)
+    depth = array("i", [0]) * n_nodes
+    parent = array("i", [-1]) * n_nodes
+
+    # Start nodes absent from the graph have no edges and are never reported
+    frontier: list[int] = []
+    for node in start_nodes:
+        sid = graph.ids.get(node)
+        if sid is not None and not visited[sid]:
+            visited[sid] = 1
+            frontier.append(sid)
+
+    # Level-synchronous: each level is the slice of discovered appended while
+    # expanding the previous one, which is exactly FIFO order without a
+    # queue or per-pop depth lookups. The max_depth level is never expanded.
+    # Start nodes are never discovered, so they are excluded from results.
+    discovered: list[int] = []
+    append = discovered.append
+    for next_depth in range(1, max_depth + 1):
+        level_start = len(discovered)
+        for current in frontier:
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    depth[neighbor] = next_depth
+                    parent[neighbor] = current
+                    append(neighbor)
+        frontier = discovered[level_start:]
+        if not frontier:
+            break
+
+    return discovered, depth, parent
+
+
 def compute_affected_set(
     start_nodes: list[str],
-    adjacency: dict[str, set[str]],
+    adjacency: Union[dict[str, set[str]], _CsrGraph],
     max_depth: int = 5,
 ) -> list[AffectedResource]:
     """BFS from start_nodes through adjacency, bounded by max_depth.
 
     Returns list of AffectedResource with traversal paths.
     Keeps shortest path when reached from multiple starts.
-    """
-    visited: dict[str, AffectedResource] = {}
-    queue: deque[tuple[str, int, list[str]]] = deque()
 
-    for node in start_nodes:
-        queue.append((node, 0, [node]))
-        visited[node] = AffectedResource(
-            address=node, resource_type="", depth=0, path=[node]
+    The traversal runs over integer node ids in CSR form (see _bfs_csr), so
+    no per-edge path lists are allocated; paths are rebuilt from parent
+    pointers once the BFS finishes.
+    """
+    graph = adjacency if isinstance(adjacency, _CsrGraph) else _to_csr(adjacency)
+    discovered, depth, parent = _bfs_csr(graph, start_nodes, max_depth)
+    return [
+        AffectedResource(
+            address=graph.names[node],
+            resource_type="",
+            depth=depth[node],
+            path=_reconstruct_path(node, parent, graph.names),
         )
-
-    while queue:
-        current, depth, path = queue.popleft()
-        if depth >= max_depth:
-            continue
-
-        for neighbor in adjacency.get(current, set()):
-            if neighbor not in visited:
-                new_path = path + [neighbor]
-                visited[neighbor] = AffectedResource(
-                    address=neighbor,
-                    resource_type="",
-                    depth=depth + 1,
-                    path=new_path,
-                )
-                queue.append((neighbor, depth + 1, new_path))
-
-    # Remove start nodes from results (they are the changes, not affected)
-    return [ar for ar in visited.values() if ar.address not in start_nodes]
+        for node in discovered
+    ]
 
 
 def compute_tiered_affected(
     changed_nodes: list[ImpactNode],
-    adjacency: dict[str, set[str]],
+    adjacency: Union[dict[str, set[str]], _CsrGraph],
     max_depth: int = 5,
 ) -> tuple[list[AffectedResource], list[AffectedResource]]:
     """Compute tiered affected sets: L1 (direct) and L2 (indirect).
 
     L2 is only populated if any L0 node is a boundary resource or
-    involves a delete/replace action.
+    involves a delete/replace action. When L2 is gated off the BFS stops
+    at depth 1, so no deeper nodes are visited or given paths.
 
     Returns (l1_affected, l2_affected).
     """
     start_addrs = [n.address for n in changed_nodes]
 
+    # Gate L2: only include if L0 has boundary resources or delete/replace
+    has_boundary = any(_is_boundary_node(n) for n in changed_nodes)
+    has_destructive = any(n.action in ("delete", "replace") for n in changed_nodes)
+    if not (has_boundary or has_destructive):
+        max_depth = min(max_depth, 1)
+
     # Always compute L1 (depth 1)
     all_affected = compute_affected_set(start_addrs, adjacency, max_depth=max_depth)
     l1 = [ar for ar in all_affected if ar.depth == 1]
     l2 = [ar for ar in all_affected if ar.depth >= 2]
 
-    # Gate L2: only include if L0 has boundary resources or delete/replace
-    has_boundary = any(is_boundary_resource(n.resource_type) for n in changed_nodes)
-    has_destructive = any(n.action in ("delete", "replace") for n in changed_nodes)
-
-    if not (has_boundary or has_destructive):
-        l2 = []
-
     return l1, l2
 
 
@@ -532,29 +756,39 @@ def compute_impact_score(
     """
     score = 0.0
 
-    # No-ops/reads are already excluded by analyze_change_impact() before this call.
-    # Greenfield: all active changes are creates.
-    is_greenfield = bool(changed_nodes) and all(
-        node.action == "create" for node in changed_nodes
-    )
-
-    # 1. Action points for each L0 resource
+    # 1. Action points for each L0 resource, in one pass over the nodes.
+    # Greenfield (all active changes are creates) is only known after the
+    # loop, so both the greenfield and the standard totals are accumulated
+    # and the right one is picked at the end. No-ops/reads are already
+    # excluded by analyze_change_impact() before this call.
+    action_points_get = ACTION_POINTS.get
+    is_greenfield = bool(changed_nodes)
     all_updates_no_boundary = True
+    has_wildcard_trust = False
     action_points = 0.0
+    greenfield_action_points = 0.0
 
     for node in changed_nodes:
-        points = ACTION_POINTS.get(node.action, 0)
-        if is_boundary_resource(node.resource_type):
-            points *= 1.5
-            if is_greenfield:
-                points *= GREENFIELD_BOUNDARY_MULTIPLIER
+        action = node.action
+        is_boundary = _is_boundary_node(node)
+        base_points = action_points_get(action, 0)
+        if is_boundary:
+            points = base_points * 1.5
+            greenfield_points = points * GREENFIELD_BOUNDARY_MULTIPLIER
         else:
-            if is_greenfield:
-                points *= GREENFIELD_MULTIPLIER
-        if node.action != "update" or is_boundary_resource(node.resource_type):
+            points = base_points
+            greenfield_points = base_points * GREENFIELD_MULTIPLIER
+        if action != "create":
+            is_greenfield = False
+        if action != "update" or is_boundary:
             all_updates_no_boundary = False
-        points += node.sensitivity_delta  # IAM policy change bonus (not discounted)
-        action_points += points
+        has_wildcard_trust = has_wildcard_trust or node.wildcard_trust
+        # IAM policy change bonus (not discounted)
+        action_points += points + node.sensitivity_delta
+        greenfield_action_points += greenfield_points + node.sensitivity_delta
+
+    if is_greenfield:
+        action_points = greenfield_action_points
 
     score += action_points
 
@@ -583,7 +817,7 @@ def compute_impact_score(
         score = min(score, 45.0)
 
     # Wildcard trust floor: a "*" principal in an IAM trust policy is always HIGH.
-    if any(n.wildcard_trust for n in changed_nodes):
+    if has_wildcard_trust:
         score = max(score, 50.0)
 
     # Clamp
@@ -620,14 +854,14 @@ def build_score_explanation(
 
     is_greenfield = all(node.action == "create" for node in nodes)
     all_updates_no_boundary = all(
-        node.action == "update" and not is_boundary_resource(node.resource_type)
+        node.action == "update" and not _is_boundary_node(node)
         for node in nodes
     )
 
     # Action bullets — one per changed node
     for node in nodes:
         base_points = ACTION_POINTS.get(node.action, 0)
-        is_boundary = is_boundary_resource(node.resource_type)
+        is_boundary = _is_boundary_node(node)
         points = float(base_points)
         qualifiers: list[str] = []
 
@@ -718,16 +952,28 @@ def build_score_explanation(
 # ---------------------------------------------------------------------------
 
 
-def _history_cluster_key(fix: Fix) -> str:
-    """Return dedup cluster key: first CamelCase error token, or first 4 words."""
-    issue = fix.issue or ""
-    m = re.search(r'[A-Z][a-z]+(?:[A-Z][a-z]+)+', issue)
+_CAMEL_CASE_TOKEN_RE = re.compile(r'[A-Z][a-z]+(?:[A-Z][a-z]+)+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=4096)
+def _cluster_key_from_issue(issue: str) -> str:
+    """Return the dedup cluster key for an issue string.
+
+    Memoized because the same issue text is keyed on every analysis run.
+    """
+    m = _CAMEL_CASE_TOKEN_RE.search(issue)
     if m:
         return m.group()
-    words = re.sub(r'[^\w\s]', '', issue).lower().split()[:4]
+    words = _PUNCTUATION_RE.sub('', issue).lower().split()[:4]
     return ' '.join(words)
 
 
+def _history_cluster_key(fix: Fix) -> str:
+    """Return dedup cluster key: first CamelCase error token, or first 4 words."""
+    return _cluster_key_from_issue(fix.issue or "")
+
+
 def _dedup_history_candidates(
     candidates: list[tuple[Fix, str]]
 ) -> list[tuple[Fix, str]]:
@@ -749,6 +995,18 @@ def _dedup_history_candidates(
     return list(clusters.values())
 
 
+@lru_cache(maxsize=1024)
+def _has_history_category_tag(tags: str) -> bool:
+    """Return True if a comma-separated tag string has a category tag.
+
+    Memoized on the raw tags string: the same fix comes back once per
+    matching resource type, and tag strings repeat across fixes.
+    """
+    return any(
+        t.strip().lower() in _HISTORY_CATEGORY_TAGS for t in tags.split(",")
+    )
+
+
 def compute_history_prior(
     changed_resource_types: list[str],
     changed_nodes: list[ImpactNode],
@@ -763,7 +1021,7 @@ def compute_history_prior(
     - A fix's issue/error_excerpt mentions a changed resource address exactly.
     Matches are category-tag filtered, deduped, and capped at 3.
     """
-    has_boundary = any(is_boundary_resource(n.resource_type) for n in changed_nodes)
+    has_boundary = any(_is_boundary_node(n) for n in changed_nodes)
     has_destructive = any(n.action in ("delete", "replace") for n in changed_nodes)
     changed_addresses = {n.address.lower() for n in changed_nodes}
 
@@ -771,25 +1029,19 @@ def compute_history_prior(
     candidates: list[tuple[Fix, str]] = []  # (fix, resource_type)
 
     # Phase 1: Address-match override — works even without gate
-    for fix in repo.list_all():
-        fix_searchable = " ".join(filter(None, [fix.issue, fix.error_excerpt])).lower()
-        if any(addr in fix_searchable for addr in changed_addresses):
-            if fix.id not in seen_ids:
-                seen_ids.add(fix.id)
-                candidates.append((fix, ""))
+    for fix in repo.find_by_addresses(changed_addresses):
+        if fix.id not in seen_ids:
+            seen_ids.add(fix.id)
+            candidates.append((fix, ""))
 
     # Phase 2: Resource-type + category tag — only when gate passes
     if has_boundary or has_destructive:
-        for rt in changed_resource_types:
-            for fix in repo.find_by_resource_type(rt):
-                if fix.id in seen_ids:
-                    continue
-                if not fix.tags:
-                    continue
-                fix_tags = {t.strip().lower() for t in fix.tags.split(",") if t.strip()}
-                if fix_tags & _HISTORY_CATEGORY_TAGS:
-                    seen_ids.add(fix.id)
-                    candidates.append((fix, rt))
+        for rt, fix in repo.find_by_resource_types(changed_resource_types):
+            if fix.id in seen_ids:
+                continue
+            if _has_history_category_tag(fix.tags):
+                seen_ids.add(fix.id)
+                candidates.append((fix, rt))
 
     if not candidates:
         return 0, []
@@ -935,48 +1187,73 @@ def redact_plan_values(change_block: dict) -> dict:
     3. Replaces values with '[REDACTED]'.
     """
     result = {}
-    sensitive_keys = set()
+    sensitive_tree: dict = {}
 
-    # Collect keys flagged by Terraform's sensitive_values
+    # Merge the markers flagged by Terraform's sensitive_values into one tree
     for phase in ("before_sensitive", "after_sensitive"):
         sv = change_block.get(phase)
         if isinstance(sv, dict):
-            _collect_sensitive_keys(sv, "", sensitive_keys)
+            _merge_sensitive_tree(sv, sensitive_tree)
 
     for key, value in change_block.items():
         if key in ("before_sensitive", "after_sensitive"):
             continue
         if isinstance(value, dict):
-            result[key] = _redact_dict(value, sensitive_keys, "")
+            result[key] = _redact_dict(value, sensitive_tree)
         else:
             result[key] = value
 
     return result
 
 
-def _collect_sensitive_keys(
-    sensitive_map: dict, prefix: str, out: set[str]
-) -> None:
-    """Recursively collect keys marked as sensitive."""
+def _merge_sensitive_tree(sensitive_map: dict, out: dict) -> None:
+    """Recursively merge a sensitive_values map into out.
+
+    Leaves marked True stay True; a True leaf wins over a nested map for
+    the same key, since the whole subtree is then redacted.
+    """
     for key, val in sensitive_map.items():
-        full_key = f"{prefix}.{key}" if prefix else key
         if val is True:
-            out.add(full_key)
-        elif isinstance(val, dict):
-            _collect_sensitive_keys(val, full_key, out)
+            out[key] = True
+        elif isinstance(val, dict) and val:
+            sub = out.get(key)
+            if sub is True:
+                continue
+            if sub is None:
+                sub = out[key] = {}
+            _merge_sensitive_tree(val, sub)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Return True if a key name matches SENSITIVE_PATTERNS.
+
+    Memoized because the same attribute names repeat across every resource.
+    """
+    return SENSITIVE_PATTERNS.search(key) is not None
 
 
-def _redact_dict(
-    d: dict, sensitive_keys: set[str], prefix: str
-) -> dict:
-    """Recursively redact sensitive values in a dict."""
+def _redact_dict(d: dict, sensitive_tree: Optional[dict]) -> dict:
+    """Recursively redact sensitive values in a dict.
+
+    sensitive_tree is the marker subtree at the same depth as d, so
+    marker lookups are a dict get rather than a dotted-path string.
+    """
+    if not sensitive_tree and SENSITIVE_PATTERNS.search("\n".join(d)) is None:
+        # No markers and no sensitive key name at this level: one regex pass
+        # over the joined keys clears them all, so only nested dicts recurse
+        return {
+            key: _redact_dict(val, None) if isinstance(val, dict) else val
+            for key, val in d.items()
+        }
+
     result = {}
     for key, val in d.items():
-        full_key = f"{prefix}.{key}" if prefix else key
-        if full_key in sensitive_keys or SENSITIVE_PATTERNS.search(key):
+        marker = sensitive_tree.get(key) if sensitive_tree else None
+        if marker is True or _is_sensitive_key(key):
             result[key] = "[REDACTED]"
         elif isinstance(val, dict):
-            result[key] = _redact_dict(val, sensitive_keys, full_key)
+            result[key] = _redact_dict(val, marker)
         else:
             result[key] = val
     return result
@@ -1039,9 +1316,7 @@ def extract_change_fingerprint(change_block: dict) -> dict:
         if cat:
             attr_categories.add(cat)
 
-    sensitive_changed = any(
-        SENSITIVE_PATTERNS.search(attr) for attr in changed_attrs
-    )
+    sensitive_changed = any(_is_sensitive_key(attr) for attr in changed_attrs)
 
     return {
         "changed_attrs": changed_attrs,
@@ -1227,19 +1502,22 @@ def analyze_change_impact(
     analyzer = TerraformAnalyzer(repo=repo)
     resources = analyzer.extract_resources(plan)
 
+    # Index resource_changes once so per-node lookups are O(1)
+    change_index = _build_change_index(plan)
+
     # Build change_blocks from plan if not provided
     if change_blocks is None:
-        change_blocks = {}
-        for rc in plan.get("resource_changes", []):
-            addr = rc.get("address", "")
-            cb = rc.get("change", {})
-            if addr and cb:
-                change_blocks[addr] = cb
-
-    # Build nodes and identify control points — changed only
+        change_blocks = {addr: cb for addr, cb in change_index.items() if addr and cb}
+
+    # Build nodes and identify control points — changed only. Plan-level
+    # aggregates are accumulated in the same pass.
     nodes: list[ImpactNode] = []
     control_points: list[ImpactNode] = []
     changes: list[dict] = []
+    changed_addrs: set[str] = set()
+    by_action: Counter = Counter()
+    has_boundary = False
+    has_destructive = False
 
     for res in resources:
         action = res.action
@@ -1247,11 +1525,7 @@ def analyze_change_impact(
             continue
 
         # Detect replace: ["create", "delete"]
-        raw_actions = []
-        for rc in plan.get("resource_changes", []):
-            if rc.get("address") == res.address:
-                raw_actions = rc.get("change", {}).get("actions", [])
-                break
+        raw_actions = (change_index.get(res.address) or {}).get("actions", [])
         if "create" in raw_actions and "delete" in raw_actions:
             action = "replace"
 
@@ -1277,11 +1551,15 @@ def analyze_change_impact(
             change_fingerprint=fingerprint,
         )
         nodes.append(node)
+        changed_addrs.add(res.address)
+        by_action[action] += 1
+        has_boundary = has_boundary or is_cp
+        has_destructive = has_destructive or action in ("delete", "replace")
 
         if is_cp:
             control_points.append(node)
             if node.action == "update" and node.category in ("iam", "rbac"):
-                iam_cb = _find_change_block(plan, node.address)
+                iam_cb = _find_change_block(change_index, node.address)
                 if iam_cb:
                     delta, reason, wildcard = _compute_iam_sensitivity(iam_cb)
                     node.sensitivity_delta = delta
@@ -1300,36 +1578,43 @@ def analyze_change_impact(
             }
         )
 
-    # BFS propagation if graph is available
-    l1_affected: list[AffectedResource] = []
-    l2_affected: list[AffectedResource] = []
-    all_affected: list[AffectedResource] = []
+    # BFS propagation if graph is available. Results stay in the BFS's
+    # flat depth/parent columns; only reported nodes become output dicts.
+    affected: list[dict] = []
+    l1_count = 0
+    l2_count = 0
 
     if dot_text and nodes:
-        forward, reverse = parse_dot_graph(dot_text)
-        changed_addrs = {n.address for n in nodes}
-        extra_seeds: set[str] = set()
-        for node in nodes:
-            if node.is_control_point:
-                for dep in forward.get(node.address, set()):
-                    if dep not in changed_addrs:
-                        extra_seeds.add(dep)
-
-        has_boundary = any(is_boundary_resource(n.resource_type) for n in nodes)
-        has_destructive = any(n.action in ("delete", "replace") for n in nodes)
+        # control_points was collected in the node loop; no need to re-filter nodes
+        graph, forward = _parse_dot_impact_graph(
+            dot_text, {cp.address for cp in control_points}
+        )
+        extra_seeds: dict[str, None] = {}  # ordered set
+        for cp in control_points:
+            for dep in forward.get(cp.address, ()):
+                if dep not in changed_addrs:
+                    extra_seeds[dep] = None
 
+        plan_keys = _plan_address_keys(changed_addrs)
         bfs_starts = [n.address for n in nodes] + list(extra_seeds)
-        all_ar = compute_affected_set(bfs_starts, reverse, max_depth=max_depth)
-        l1_affected = [ar for ar in all_ar if ar.depth == 1]
-        l2_affected = [ar for ar in all_ar if ar.depth >= 2]
-        if not (has_boundary or has_destructive):
-            l2_affected = []
-        all_affected = [
-            ar for ar in l1_affected + l2_affected
-            if not _addr_in_plan(ar.address, changed_addrs)
-        ]
-        l1_affected = [ar for ar in all_affected if ar.depth == 1]
-        l2_affected = [ar for ar in all_affected if ar.depth >= 2]
+        # L2 (depth >= 2) only counts when a boundary or destructive change
+        # exists; otherwise the BFS stops at depth 1 instead of discarding L2
+        kept_depth = max_depth if (has_boundary or has_destructive) else min(max_depth, 1)
+        discovered, depth, parent = _bfs_csr(graph, bfs_starts, kept_depth)
+        for i in discovered:
+            node_depth = depth[i]
+            address = graph.names[i]
+            if address in plan_keys:
+                continue
+            affected.append({
+                "address": address,
+                "depth": node_depth,
+                "path": _reconstruct_path(i, parent, graph.names),
+            })
+            if node_depth == 1:
+                l1_count += 1
+            else:
+                l2_count += 1
 
     # Unified smart matching — replaces both history_prior and resource_warnings
     relevant_fixes = find_relevant_fixes(nodes, repo, max_total=max_resource_warnings)
@@ -1354,20 +1639,16 @@ def analyze_change_impact(
         for rf in qualifying_fixes[:3]
     ]
 
-    # Impact score
-    changed_addresses = {n.address for n in nodes}
-    l1_score_count = sum(1 for ar in l1_affected if not _addr_in_plan(ar.address, changed_addresses))
-    l2_score_count = sum(1 for ar in l2_affected if not _addr_in_plan(ar.address, changed_addresses))
-
+    # Impact score — in-plan addresses were already dropped from L1/L2 above
     score = compute_impact_score(
-        nodes, l1_score_count, l2_score_count, history_count,
+        nodes, l1_count, l2_count, history_count,
         outcome_failure_count=outcome_failure_count,
     )
     sev = severity_label(score)
 
     # Score explanation bullets
     explanation = build_score_explanation(
-        nodes, l1_score_count, l2_score_count, history_count,
+        nodes, l1_count, l2_count, history_count,
         outcome_failure_count=outcome_failure_count,
     )
     score_explanation = [
@@ -1380,27 +1661,18 @@ def analyze_change_impact(
     checks = [c["check"] for c in ctx_checks]
 
     # Build why-paths for affected resources
-    why_paths = []
-    for ar in all_affected[:20]:
-        why_paths.append(
-            {
-                "target": ar.address,
-                "depth": ar.depth,
-                "path": ar.path,
-            }
-        )
+    why_paths = [
+        {"target": ar["address"], "depth": ar["depth"], "path": ar["path"]}
+        for ar in affected[:20]
+    ]
 
     # Plan summary
     plan_summary = {
         "total_changes": len(nodes),
         "control_points": len(control_points),
-        "affected_resources": len(all_affected),
-        "by_action": {},
+        "affected_resources": len(affected),
+        "by_action": dict(by_action),
     }
-    for n in nodes:
-        plan_summary["by_action"][n.action] = (
-            plan_summary["by_action"].get(n.action, 0) + 1
-        )
 
     return ImpactResult(
         score=score,
@@ -1416,14 +1688,7 @@ def analyze_change_impact(
             }
             for cp in control_points
         ],
-        affected=[
-            {
-                "address": ar.address,
-                "depth": ar.depth,
-                "path": ar.path,
-            }
-            for ar in all_affected
-        ],
+        affected=affected,
         why_paths=why_paths,
         checks=checks,
         history_matches=history_matches,
@@ -1435,9 +1700,17 @@ def analyze_change_impact(
     )
 
 
-def _find_change_block(plan: dict, address: str) -> Optional[dict]:
-    """Find the change block for a resource address in the plan."""
+def _build_change_index(plan: dict) -> dict[str, dict]:
+    """Map each resource address to its change block.
+
+    The first entry wins when an address repeats, matching a linear scan.
+    """
+    index: dict[str, dict] = {}
     for change in plan.get("resource_changes", []):
-        if change.get("address") == address:
-            return change.get("change", {})
-    return None
+        index.setdefault(change.get("address"), change.get("change", {}))
+    return index
+
+
+def _find_change_block(change_index: dict[str, dict], address: str) -> Optional[dict]:
+    """Find the change block for a resource address in a prebuilt change index."""
+    return change_index.get(address)
@@ -68,7 +68,11 @@ def resolve_pending_entries(
         click.echo(f"\n── {header} ──")
         click.echo(f"   {first.short_message[:100]}")
         click.echo("[Enter] document fix  [s] skip  [q] quit all")
-        choice = click.prompt("", default="", show_default=False).strip().lower()
+        # Choice re-prompts on a typo instead of treating it as [Enter]
+        choice = click.prompt(
+            "", default="", show_default=False, show_choices=False,
+            type=click.Choice(["", "s", "q"], case_sensitive=False),
+        )
 
         if choice == "q":
             break
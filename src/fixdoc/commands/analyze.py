@@ -3,32 +3,114 @@
 Merges plan analysis + change impact into a single command.
 """
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import click
 
 from ..change_impact import (
+    _DATACLASS_SLOTS,
     ImpactResult,
     ImpactNode,
     analyze_change_impact,
+    classify_control_point,
 )
+from .. import __version__
+from ..config import ConfigManager
 from ..relevance import format_match_narrative
 from ..models import Fix
 from ..outcomes import Outcome, OutcomeStore, compute_plan_fingerprint
 from ..storage import FixRepository
 from ..parsers.base import CloudProvider
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install fixdoc[fast]
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming parser: pip install fixdoc[fast]
+    ijson = None
+
 
 _SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 
+_CHANGED_ACTIONS = frozenset({"create", "update", "delete", "replace"})
+
+
+def _load_plan_json(plan_path: Path) -> dict:
+    """Parse a plan JSON file, using orjson when installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    if orjson is not None:
+        return orjson.loads(Path(plan_path).read_bytes())
+    with open(plan_path, "r") as f:
+        return json.load(f)
+
+
+def _plan_action(actions: list[str]) -> str:
+    """Collapse a resource_changes actions list into a single action name."""
+    action_set = set(actions)
+    if "delete" in action_set:
+        return "replace" if "create" in action_set else "delete"
+    elif "update" in action_set:
+        return "update"
+    elif "create" in action_set:
+        return "create"
+    return "no-op"
+
+
+def _trunc(text: str, limit: int = 80) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# One `module.NAME[KEY]` segment of a resource address; the lookbehind keeps
+# it to whole dot-separated segments
+_MODULE_SEG_RE = re.compile(r"(?<![^.])module\.[^.\[]+(?:\[[^\]]*\])?")
+
+
+# (resource type prefix, provider source substring, provider), checked in order
+_CLOUD_PROVIDER_MARKERS = (
+    ("aws_", "hashicorp/aws", CloudProvider.AWS),
+    ("azurerm_", "hashicorp/azurerm", CloudProvider.AZURE),
+    ("google_", "hashicorp/google", CloudProvider.GCP),
+)
+
+
+@lru_cache(maxsize=1024)
+def _detect_cloud_provider(resource_type: str, provider_name: str) -> CloudProvider:
+    """Detect cloud provider from resource type or provider name.
+
+    Memoized because a plan repeats the same (type, provider) pairs across
+    every resource of a kind.
+    """
+    resource_lower = resource_type.lower()
+    provider_lower = provider_name.lower()
+
+    for prefix, source, provider in _CLOUD_PROVIDER_MARKERS:
+        if resource_lower.startswith(prefix) or source in provider_lower:
+            return provider
+
+    return CloudProvider.UNKNOWN
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AnalysisMatch:
     """Represents a potential issue found during terraform plan analysis."""
 
@@ -43,12 +125,9 @@ class AnalysisMatch:
         issue = self.related_fix.issue
         resolution = self.related_fix.resolution
 
-        issue_preview = issue[:80] + "..." if len(issue) > 80 else issue
-        resolution_preview = resolution[:80] + "..." if len(resolution) > 80 else resolution
-
         lines = [
-            f"  FIX-{short_id}: {issue_preview}",
-            f"   Resolution: {resolution_preview}",
+            f"  FIX-{short_id}: {_trunc(issue)}",
+            f"   Resolution: {_trunc(resolution)}",
         ]
 
         if self.related_fix.tags:
@@ -57,7 +136,7 @@ class AnalysisMatch:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PlanResource:
     """Represents a resource in a Terraform plan."""
 
@@ -71,6 +150,21 @@ class PlanResource:
     before_values: dict = field(default_factory=dict)
 
 
+def _iter_planned_resources(planned_values: dict) -> Iterator[tuple[dict, str]]:
+    """Yield (resource, module_address) pairs from a planned_values tree."""
+    root = planned_values.get("root_module")
+    if not root or not (root.get("resources") or root.get("child_modules")):
+        return
+    stack = [(root, "")]
+    while stack:
+        module, prefix = stack.pop()
+        for resource in module.get("resources", []):
+            yield resource, prefix
+        # Reversed so child modules are visited in declaration order
+        for child in reversed(module.get("child_modules", [])):
+            stack.append((child, child.get("address", "")))
+
+
 class TerraformAnalyzer:
     """Analyzes terraform plan JSON output against known fixes."""
 
@@ -79,148 +173,178 @@ class TerraformAnalyzer:
 
     def load_plan(self, plan_path: Path) -> dict:
         """Load and parse a terraform plan JSON file."""
-        with open(plan_path, "r") as f:
-            return json.load(f)
+        return _load_plan_json(plan_path)
 
     def detect_cloud_provider(self, resource_type: str, provider_name: str = "") -> CloudProvider:
         """Detect cloud provider from resource type or provider name."""
-        resource_lower = resource_type.lower()
-        provider_lower = provider_name.lower()
+        return _detect_cloud_provider(resource_type, provider_name)
 
-        if resource_lower.startswith("aws_") or "hashicorp/aws" in provider_lower:
-            return CloudProvider.AWS
-        elif resource_lower.startswith("azurerm_") or "hashicorp/azurerm" in provider_lower:
-            return CloudProvider.AZURE
-        elif resource_lower.startswith("google_") or "hashicorp/google" in provider_lower:
-            return CloudProvider.GCP
+    def iter_resource_changes(self, plan_path: Path) -> Iterator[dict]:
+        """Yield the plan's resource_changes entries one at a time.
 
-        return CloudProvider.UNKNOWN
+        Streams with ijson when installed so peak memory is one change block
+        rather than the whole plan; otherwise falls back to a full parse.
+        Malformed JSON raises json.JSONDecodeError either way.
+        """
+        if ijson is None:
+            yield from _load_plan_json(plan_path).get("resource_changes", [])
+            return
+        with open(plan_path, "rb") as f:
+            try:
+                yield from ijson.items(f, "resource_changes.item", use_float=True)
+            except ijson.JSONError as exc:
+                # ijson's errors are not ValueErrors; keep the stdlib contract
+                raise json.JSONDecodeError(str(exc), "", 0) from exc
+
+    def _resource_from_change(self, change: dict) -> Optional[PlanResource]:
+        """Build a PlanResource from a single resource_changes entry."""
+        address = change.get("address", "")
+        resource_type = change.get("type", "")
+        name = change.get("name", "")
+        provider_name = change.get("provider_name", "")
+
+        if not resource_type:
+            return None
+        # Interned so the many nodes sharing a type share one string object
+        resource_type = sys.intern(resource_type)
+
+        action = _plan_action(change.get("change", {}).get("actions", []))
+
+        # Extract module path if present
+        module_path = None
+        if address.startswith("module."):
+            module_path = ".".join(_MODULE_SEG_RE.findall(address)) or None
+            if module_path:
+                # Resources in one module share the same path string
+                module_path = sys.intern(module_path)
+
+        # Get planned values
+        values = change.get("change", {}).get("after", {}) or {}
+        before_values = change.get("change", {}).get("before", {}) or {}
+
+        return PlanResource(
+            address=address,
+            resource_type=resource_type,
+            name=name,
+            cloud_provider=self.detect_cloud_provider(resource_type, provider_name),
+            action=action,
+            module_path=module_path,
+            values=values,
+            before_values=before_values,
+        )
 
     def extract_resources(self, plan: dict) -> list[PlanResource]:
-        """Extract all resources from a Terraform plan with full metadata."""
-        resources = []
+        """Extract all resources from a Terraform plan with full metadata.
+
+        Resources are keyed by address as they are built, so the first entry
+        for an address wins and no separate dedup pass is needed.
+        """
+        resources: dict[str, PlanResource] = {}
 
         # Extract from resource_changes (most reliable for planned changes)
         for change in plan.get("resource_changes", []):
-            address = change.get("address", "")
-            resource_type = change.get("type", "")
-            name = change.get("name", "")
-            provider_name = change.get("provider_name", "")
+            resource = self._resource_from_change(change)
+            if resource is not None and resource.address not in resources:
+                resources[resource.address] = resource
+
+        # Also check planned_values for additional resources
+        self._extract_from_planned_values(plan.get("planned_values", {}), resources)
+
+        return list(resources.values())
 
+    def _extract_from_planned_values(
+        self, planned_values: dict, resources: dict[str, PlanResource]
+    ) -> None:
+        """Extract resources from planned_values section into resources, by address."""
+        for resource, prefix in _iter_planned_resources(planned_values):
+            address = resource.get("address", "")
+            if address in resources:
+                continue
+
+            resource_type = resource.get("type", "")
             if not resource_type:
                 continue
+            resource_type = sys.intern(resource_type)
 
-            # Determine action
-            actions = change.get("change", {}).get("actions", [])
-            if "create" in actions and "delete" in actions:
-                action = "replace"
-            elif "delete" in actions:
-                action = "delete"
-            elif "update" in actions:
-                action = "update"
-            elif "create" in actions:
-                action = "create"
-            else:
-                action = "no-op"
-
-            # Extract module path if present
-            module_path = None
-            if address.startswith("module."):
-                parts = address.split(".")
-                module_parts = []
-                for i, part in enumerate(parts):
-                    if part == "module" and i + 1 < len(parts):
-                        module_parts.append(f"module.{parts[i + 1]}")
-                module_path = ".".join(module_parts) if module_parts else None
-
-            # Get planned values
-            values = change.get("change", {}).get("after", {}) or {}
-            before_values = change.get("change", {}).get("before", {}) or {}
-
-            resources.append(PlanResource(
+            provider_name = resource.get("provider_name", "")
+
+            resources[address] = PlanResource(
                 address=address,
                 resource_type=resource_type,
-                name=name,
+                name=resource.get("name", ""),
                 cloud_provider=self.detect_cloud_provider(resource_type, provider_name),
-                action=action,
-                module_path=module_path,
-                values=values,
-                before_values=before_values,
-            ))
-
-        # Also check planned_values for additional resources
-        self._extract_from_planned_values(plan.get("planned_values", {}), resources)
-
-        # Deduplicate by address
-        seen = set()
-        unique = []
-        for r in resources:
-            if r.address not in seen:
-                seen.add(r.address)
-                unique.append(r)
-
-        return unique
-
-    def _extract_from_planned_values(self, planned_values: dict, resources: list[PlanResource]):
-        """Extract resources from planned_values section."""
-        existing_addresses = {r.address for r in resources}
-
-        def process_module(module: dict, prefix: str = ""):
-            # Process resources in this module
-            for resource in module.get("resources", []):
-                address = resource.get("address", "")
-                if address in existing_addresses:
-                    continue
-
-                resource_type = resource.get("type", "")
-                if not resource_type:
-                    continue
-
-                provider_name = resource.get("provider_name", "")
-
-                resources.append(PlanResource(
-                    address=address,
-                    resource_type=resource_type,
-                    name=resource.get("name", ""),
-                    cloud_provider=self.detect_cloud_provider(resource_type, provider_name),
-                    action="unknown",
-                    module_path=prefix or None,
-                    values=resource.get("values", {}),
-                ))
-                existing_addresses.add(address)
-
-            # Process child modules
-            for child in module.get("child_modules", []):
-                child_address = child.get("address", "")
-                process_module(child, child_address)
-
-        root = planned_values.get("root_module", {})
-        process_module(root)
+                action="unknown",
+                module_path=prefix or None,
+                values=resource.get("values", {}),
+            )
 
     def extract_resource_types(self, plan: dict) -> list[tuple[str, str]]:
         """Extract (resource_address, resource_type) tuples from a plan.
 
-        This is a simplified version for backward compatibility.
+        This is a simplified version for backward compatibility. Builds the
+        tuples in a single pass keyed by address instead of materializing
+        full PlanResource objects and deduplicating afterwards.
         """
-        resources = self.extract_resources(plan)
-        return [(r.address, r.resource_type) for r in resources]
+        types_by_address: dict[str, str] = {}
+
+        for change in plan.get("resource_changes", []):
+            resource_type = change.get("type", "")
+            if resource_type:
+                types_by_address.setdefault(change.get("address", ""), resource_type)
+
+        for resource, _ in _iter_planned_resources(plan.get("planned_values", {})):
+            resource_type = resource.get("type", "")
+            if resource_type:
+                types_by_address.setdefault(resource.get("address", ""), resource_type)
+
+        return list(types_by_address.items())
 
     def get_changed_resources(self, plan: dict) -> list[PlanResource]:
         """Get only resources that are actually changing (not no-op/read/unknown)."""
         resources = self.extract_resources(plan)
-        return [
-            r for r in resources
-            if r.action in ("create", "update", "delete", "replace")
-        ]
+        return [r for r in resources if r.action in _CHANGED_ACTIONS]
+
+    def iter_changed_resources(self, plan_path: Path) -> Iterator[PlanResource]:
+        """Yield changing resources from a plan file as they are parsed.
+
+        planned_values entries never carry a real action, so only
+        resource_changes needs to be read.
+        """
+        seen = set()
+        for change in self.iter_resource_changes(plan_path):
+            resource = self._resource_from_change(change)
+            if resource is None or resource.address in seen:
+                continue
+            seen.add(resource.address)
+            if resource.action in _CHANGED_ACTIONS:
+                yield resource
+
+    def get_changed_resources_from_file(self, plan_path: Path) -> list[PlanResource]:
+        """Get changing resources straight from a plan file in one streaming pass."""
+        return list(self.iter_changed_resources(plan_path))
 
     def analyze(self, plan_path: Path) -> list[AnalysisMatch]:
         """Analyze a terraform plan for potential issues based on past fixes."""
-        plan = self.load_plan(plan_path)
-        resources = self.get_changed_resources(plan)
+        return self._match_resources(self.get_changed_resources_from_file(plan_path))
+
+    def analyze_plan(self, plan: dict) -> list[AnalysisMatch]:
+        """Analyze an already-parsed plan, for callers holding it in memory."""
+        return self._match_resources(self.get_changed_resources(plan))
+
+    def _match_resources(self, resources: list[PlanResource]) -> list[AnalysisMatch]:
+        """Pair each changing resource with the past fixes tagged with its type."""
         matches = []
+        if not resources:
+            return matches
+
+        # One database read for every distinct type in the plan
+        types = list(dict.fromkeys(r.resource_type for r in resources))
+        fixes_by_type: dict[str, list[Fix]] = defaultdict(list)
+        for resource_type, fix in self.repo.find_by_resource_types(types):
+            fixes_by_type[resource_type].append(fix)
 
         for resource in resources:
-            for fix in self.repo.find_by_resource_type(resource.resource_type):
+            for fix in fixes_by_type.get(resource.resource_type, ()):
                 matches.append(
                     AnalysisMatch(
                         resource_address=resource.address,
@@ -234,16 +358,21 @@ class TerraformAnalyzer:
 
     def analyze_and_format(self, plan_path: Path) -> str:
         """Analyze a plan and return formatted output."""
-        matches = self.analyze(plan_path)
+        return self._format_matches(self.analyze(plan_path))
+
+    def analyze_plan_and_format(self, plan: dict) -> str:
+        """Analyze an already-parsed plan and return formatted output."""
+        return self._format_matches(self.analyze_plan(plan))
 
+    def _format_matches(self, matches: list[AnalysisMatch]) -> str:
+        """Render analysis matches grouped by cloud provider."""
         if not matches:
             return "No known issues found for resources in this plan."
 
         # Group by cloud provider
-        by_provider = {}
+        by_provider: dict[str, list[AnalysisMatch]] = defaultdict(list)
         for match in matches:
-            provider = match.cloud_provider.value
-            by_provider.setdefault(provider, []).append(match)
+            by_provider[match.cloud_provider.value].append(match)
 
         lines = [
             f"Found {len(matches)} potential issue(s) based on your fix history:",
@@ -252,35 +381,51 @@ class TerraformAnalyzer:
 
         for provider, provider_matches in by_provider.items():
             if provider != "unknown":
-                lines.append(f"-- {provider.upper()} --")
-                lines.append("")
+                lines.extend((f"-- {provider.upper()} --", ""))
 
             for match in provider_matches:
-                lines.append(match.format_warning())
-                lines.append("")
+                lines.extend((match.format_warning(), ""))
 
         lines.append("Run `fixdoc show <fix-id>` for full details on any fix.")
         return "\n".join(lines)
 
     def get_plan_summary(self, plan_path: Path) -> dict:
-        """Get a summary of the plan resources by cloud provider and action."""
-        plan = self.load_plan(plan_path)
-        resources = self.get_changed_resources(plan)
-
-        summary = {
-            "total": len(resources),
-            "by_provider": {},
-            "by_action": {},
-            "by_type": {},
-        }
+        """Get a summary of the plan resources by cloud provider and action.
 
-        for r in resources:
-            provider = r.cloud_provider.value
-            summary["by_provider"][provider] = summary["by_provider"].get(provider, 0) + 1
-            summary["by_action"][r.action] = summary["by_action"].get(r.action, 0) + 1
-            summary["by_type"][r.resource_type] = summary["by_type"].get(r.resource_type, 0) + 1
+        Counts are taken straight off the raw resource_changes stream, with
+        the same filtering as iter_changed_resources but without building a
+        PlanResource for each entry.
+        """
+        total = 0
+        by_provider: Counter = Counter()
+        by_action: Counter = Counter()
+        by_type: Counter = Counter()
+        seen = set()
 
-        return summary
+        for change in self.iter_resource_changes(plan_path):
+            resource_type = change.get("type", "")
+            address = change.get("address", "")
+            if not resource_type or address in seen:
+                continue
+            seen.add(address)
+            action = _plan_action(change.get("change", {}).get("actions", []))
+            if action not in _CHANGED_ACTIONS:
+                continue
+
+            provider = _detect_cloud_provider(
+                resource_type, change.get("provider_name", "")
+            ).value
+            total += 1
+            by_provider[provider] += 1
+            by_action[action] += 1
+            by_type[resource_type] += 1
+
+        return {
+            "total": total,
+            "by_provider": dict(by_provider),
+            "by_action": dict(by_action),
+            "by_type": dict(by_type),
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -320,6 +465,13 @@ def _group_warnings(warnings: list) -> dict:
     return groups
 
 
+def _format_check_line(check_item: dict) -> str:
+    """Render one contextual check as a human-readable bullet."""
+    resource = check_item.get("resource", "")
+    resource_suffix = f" ({resource})" if resource else ""
+    return f"  - [{check_item.get('source', '')}] {check_item.get('check', '')}{resource_suffix}"
+
+
 def _format_human(
     result: ImpactResult,
     changed: list[PlanResource],
@@ -328,32 +480,21 @@ def _format_human(
     ai_narrative: Optional[str] = None,
 ) -> str:
     """Format unified analysis result for human-readable terminal output."""
-    lines = []
-
     # Header
-    lines.append("Terraform Plan Analysis")
-    lines.append("=" * 23)
+    lines = ["Terraform Plan Analysis", "=" * 23]
 
     # Change summary
-    by_action = result.plan_summary.get("by_action", {})
-    creates = by_action.get("create", 0)
-    updates = by_action.get("update", 0)
-    deletes = by_action.get("delete", 0)
-    replaces = by_action.get("replace", 0)
-    total = result.plan_summary.get("total_changes", 0)
-
-    parts = []
-    if creates:
-        parts.append(f"{creates} create")
-    if updates:
-        parts.append(f"{updates} update")
-    if deletes:
-        parts.append(f"{deletes} delete")
-    if replaces:
-        parts.append(f"{replaces} replace")
-
-    lines.append(f"{total} resources changing ({', '.join(parts) if parts else 'none'})")
-    lines.append("")
+    ps = result.plan_summary
+    by_action = ps.get("by_action") or {}
+    total = ps.get("total_changes", 0)
+
+    counts = (
+        (action, by_action.get(action, 0))
+        for action in ("create", "update", "delete", "replace")
+    )
+    parts = [f"{count} {action}" for action, count in counts if count]
+
+    lines.extend((f"{total} resources changing ({', '.join(parts) if parts else 'none'})", ""))
 
     # Risk score
     sev = result.severity.upper()
@@ -365,27 +506,25 @@ def _format_human(
     }
     color = sev_colors.get(sev, "white")
     score_line = f"Risk Score: {result.score} / 100  [{sev}]"
-    lines.append(click.style(score_line, fg=color))
-    lines.append("")
+    lines.extend((click.style(score_line, fg=color), ""))
 
     # AI narrative block (plan-level summary, shown at top before score explanation)
     if ai_narrative:
         lines.append("AI Summary:")
-        for line in ai_narrative.strip().splitlines():
-            lines.append(f"  {line}")
+        lines.extend(f"  {line}" for line in ai_narrative.strip().splitlines())
         lines.append("")
 
     # Score explanation block
     if ai_explanation:
         lines.append(f"Why this scored {sev} (AI analysis):")
-        for line in ai_explanation.strip().splitlines():
-            lines.append(f"  {line}")
+        lines.extend(f"  {line}" for line in ai_explanation.strip().splitlines())
         lines.append("")
     elif result.score_explanation:
         lines.append(f"Why this scored {sev}:")
-        for item in result.score_explanation:
-            delta_str = f" (+{item['delta']:.0f})" if item["delta"] > 0 else ""
-            lines.append(f"  \u2022 {item['label']}{delta_str}")
+        lines.extend(
+            f"  \u2022 {item['label']}" + (f" (+{item['delta']:.0f})" if item["delta"] > 0 else "")
+            for item in result.score_explanation
+        )
         lines.append("")
 
     # Changes list
@@ -395,7 +534,6 @@ def _format_human(
             action_str = res.action.upper()
             addr = res.address
             cp_info = ""
-            from ..change_impact import classify_control_point
             cp = classify_control_point(res.resource_type)
             if cp:
                 cp_info = f"  [{cp[0]} boundary]"
@@ -407,11 +545,10 @@ def _format_human(
         count = len(result.affected)
         display_limit = 10
         lines.append(f"Impacted Resources ({count}):")
-        for ar in result.affected[:display_limit]:
-            addr = ar["address"]
-            depth = ar["depth"]
-            via = ar["path"][0] if ar["path"] else "?"
-            lines.append(f"  {addr:<40}(depth: {depth}, via: {via})")
+        lines.extend(
+            f"  {ar['address']:<40}(depth: {ar['depth']}, via: {ar['path'][0] if ar['path'] else '?'})"
+            for ar in result.affected[:display_limit]
+        )
         if count > display_limit:
             lines.append(f"  ... and {count - display_limit} more")
         lines.append("")
@@ -434,12 +571,13 @@ def _format_human(
             if not narrative:
                 narrative = format_match_narrative(fix_entry)
 
-            lines.append("")
-            lines.append(f"  FIX-{short_id} [{confidence}]:")
-            lines.append(f"    {narrative}")
-
-            res_disp = resolution[:100] + "..." if len(resolution) > 100 else resolution
-            lines.append(f"    \u2192 {res_disp}")
+            res_disp = _trunc(resolution, 100)
+            lines.extend((
+                "",
+                f"  FIX-{short_id} [{confidence}]:",
+                f"    {narrative}",
+                f"    \u2192 {res_disp}",
+            ))
 
             if verbose:
                 score_val = fix_entry.get("score", 0)
@@ -462,9 +600,7 @@ def _format_human(
             if similar > 0:
                 lines.append(f"    [+{similar} similar fixes]")
 
-        lines.append("")
-        lines.append("Run `fixdoc show <short_id>` for full details.")
-        lines.append("")
+        lines.extend(("", "Run `fixdoc show <short_id>` for full details.", ""))
 
     # Contextual Checks
     ctx_checks = result.contextual_checks if result.contextual_checks else []
@@ -473,12 +609,7 @@ def _format_human(
         ctx_checks = [{"check": c, "source": "category", "resource": ""} for c in result.checks]
     if ctx_checks:
         lines.append("Contextual Checks:")
-        for check_item in ctx_checks:
-            source = check_item.get("source", "")
-            resource = check_item.get("resource", "")
-            check_text = check_item.get("check", "")
-            resource_suffix = f" ({resource})" if resource else ""
-            lines.append(f"  - [{source}] {check_text}{resource_suffix}")
+        lines.extend(_format_check_line(check_item) for check_item in ctx_checks)
         lines.append("")
 
     # Historical Apply Outcomes
@@ -498,12 +629,26 @@ def _format_human(
     return "\n".join(lines)
 
 
+def _dumps_json(data: dict, pretty: bool = False) -> str:
+    """Serialize to JSON, using orjson when installed.
+
+    Output is compact unless pretty is set, in which case it is indented
+    by two spaces.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    if pretty:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
 def _format_json(
     result: ImpactResult,
     plan_fingerprint: Optional[str] = None,
     outcome_id: Optional[str] = None,
+    pretty: bool = False,
 ) -> str:
-    """Format change impact result as JSON."""
+    """Format change impact result as JSON (compact unless pretty)."""
     # Serialize relevant_fixes: convert sets to lists for JSON compatibility
     serializable_fixes = []
     for rf in result.relevant_fixes:
@@ -547,7 +692,7 @@ def _format_json(
         data["plan_fingerprint"] = plan_fingerprint
     if outcome_id is not None:
         data["outcome_id"] = outcome_id
-    return json.dumps(data, indent=2)
+    return _dumps_json(data, pretty=pretty)
 
 
 def _format_summary(result: ImpactResult) -> str:
@@ -647,7 +792,7 @@ def _format_markdown(result: ImpactResult) -> str:
                 narrative = format_match_narrative(f)
 
             resolution = f.get("resolution", "")
-            res_disp = resolution[:100] + "..." if len(resolution) > 100 else resolution
+            res_disp = _trunc(resolution, 100)
 
             similar_str = f" [+{similar} similar]" if similar > 0 else ""
             lines.append(f"- **FIX-{short_id}** [{confidence}]{similar_str}: {narrative}")
@@ -751,17 +896,14 @@ def generate_ai_narrative(
         return None
 
     # Build resource summary string: group by action
-    action_groups: dict = {}
+    action_groups: dict[str, list[str]] = defaultdict(list)
     for r in changed:
-        action_groups.setdefault(r.action, []).append(r.resource_type)
+        action_groups[r.action].append(r.resource_type)
 
     resource_parts = []
     for action, types in action_groups.items():
         # Count occurrences per type
-        type_counts: dict = {}
-        for t in types:
-            type_counts[t] = type_counts.get(t, 0) + 1
-        for rtype, count in type_counts.items():
+        for rtype, count in Counter(types).items():
             if count > 1:
                 resource_parts.append(f"{rtype} ({action} ×{count})")
             else:
@@ -813,13 +955,204 @@ def generate_ai_narrative(
         return None
 
 
-def _auto_run_terraform_graph() -> Optional[str]:
+_TERRAFORM_GRAPH_INPUTS = (".tf", ".tf.json", ".terraform.lock.hcl")
+
+# Each cache directory keeps at most this many entries; the ones modified
+# longest ago are deleted first
+_CACHE_MAX_ENTRIES = 64
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text to a temporary file beside path, then rename it over path.
+
+    A reader never sees a partial file, even if the writer is interrupted.
+    Raises OSError after removing the temporary file.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _prune_cache_dir(cache_dir: Path, pattern: str, keep: int) -> None:
+    """Delete all but the `keep` most recently modified files matching pattern."""
+    entries = []
+    for path in cache_dir.glob(pattern):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue  # Removed by a concurrent run
+    entries.sort(reverse=True)
+    for _, path in entries[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _terraform_module_dirs(workdir: Path) -> list[Path]:
+    """Return the module directories listed in .terraform/modules/modules.json.
+
+    The root module (Dir ".") is left out; a missing or unreadable manifest
+    yields no directories.
+    """
+    manifest = workdir / ".terraform" / "modules" / "modules.json"
+    try:
+        modules = json.loads(manifest.read_text()).get("Modules") or []
+    except (OSError, ValueError, AttributeError):
+        return []
+    dirs = {m.get("Dir") for m in modules if isinstance(m, dict)}
+    return [workdir / d for d in sorted(d for d in dirs if d and d != ".")]
+
+
+def _terraform_graph_cache_key(workdir: Path) -> Optional[str]:
+    """Hash a working directory and the Terraform files that shape its graph.
+
+    The key covers the directory path plus (relative path, mtime, size) of
+    the top-level .tf/.tf.json files, the lock file, the module manifest and
+    the .tf files of each module directory it lists. Nothing is walked
+    recursively, so .git, node_modules and provider caches are never read.
+    Returns None when there are no Terraform files to key on.
+    """
+    entries = [
+        p for p in workdir.iterdir()
+        if p.name.endswith(_TERRAFORM_GRAPH_INPUTS) and p.is_file()
+    ]
+    if not entries:
+        return None
+    manifest = workdir / ".terraform" / "modules" / "modules.json"
+    if manifest.is_file():
+        entries.append(manifest)
+    for module_dir in _terraform_module_dirs(workdir):
+        if module_dir.is_dir():
+            entries.extend(
+                p for p in module_dir.iterdir()
+                if p.name.endswith((".tf", ".tf.json")) and p.is_file()
+            )
+
+    digest = hashlib.blake2b(str(workdir.resolve()).encode(), digest_size=16)
+    for path in sorted(entries):
+        stat = path.stat()
+        rel = os.path.relpath(path, workdir).replace(os.sep, "/")
+        digest.update(f"\0{rel}\0{stat.st_mtime_ns}\0{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+# Cached analysis results older than this are recomputed; history scoring
+# includes a recency bonus, so results cannot be reused indefinitely
+_IMPACT_CACHE_TTL = 24 * 60 * 60
+
+# Per-run fields that are regenerated rather than served from the cache
+_IMPACT_CACHE_FRESH_FIELDS = ("analysis_id", "timestamp", "outcome_matches")
+
+
+def _file_stamp(path: Path) -> str:
+    """Return path's mtime and size as a cache-key fragment ("-" if missing)."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _impact_cache_key(
+    plan_path: Path, dot_text: Optional[str], repo: FixRepository, **params
+) -> str:
+    """Hash everything analyze_change_impact reads for one run.
+
+    Covers the fixdoc version, the plan file bytes, the DOT graph, the
+    mtime and size of the fix database and of config.yaml beside it, and
+    the analysis parameters (passed as keyword arguments). Capturing or
+    editing a fix changes the database stamp, so its result is recomputed.
+    """
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    with open(plan_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(b"\0" + (dot_text or "").encode())
+    digest.update(f"\0{_file_stamp(repo.db_path)}".encode())
+    digest.update(f"\0{_file_stamp(repo.base_path / ConfigManager.CONFIG_FILE)}".encode())
+    for name in sorted(params):
+        digest.update(f"\0{name}={params[name]!r}".encode())
+    return digest.hexdigest()
+
+
+def _load_cached_impact(cache_path: Path) -> Optional[ImpactResult]:
+    """Return the cached ImpactResult at cache_path, or None if absent or stale.
+
+    Stale and unreadable entries are deleted so they are not found again.
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime > _IMPACT_CACHE_TTL:
+            cache_path.unlink()
+            return None
+        raw = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return ImpactResult(**data)
+    except (ValueError, TypeError):
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+        return None
+
+
+def _store_cached_impact(cache_path: Path, result: ImpactResult) -> None:
+    """Write result to cache_path, leaving out per-run fields.
+
+    The entry is written atomically (see _write_atomic), then the directory
+    is pruned to the _CACHE_MAX_ENTRIES most recently written results.
+    Serialization errors are not caught: a field that can't be stored is a
+    bug, not a cache miss.
+    """
+    data = {
+        f.name: getattr(result, f.name)
+        for f in fields(result)
+        if f.name not in _IMPACT_CACHE_FRESH_FIELDS
+    }
+    text = _dumps_json(data)
+    try:
+        _write_atomic(cache_path, text)
+        _prune_cache_dir(cache_path.parent, "*.json", _CACHE_MAX_ENTRIES)
+    except OSError:
+        pass  # Non-critical: the result is still used
+
+
+def _auto_run_terraform_graph(cache_dir: Optional[Path] = None) -> Optional[str]:
     """Try to run `terraform graph` if terraform is on PATH.
 
+    When cache_dir is given, the DOT output is stored there keyed by
+    _terraform_graph_cache_key and reused while the Terraform files in the
+    working directory are unchanged. Entries are written atomically, touched
+    on reuse, and pruned to the _CACHE_MAX_ENTRIES most recently used.
+
     Returns DOT text or None.
     """
     if not shutil.which("terraform"):
         return None
+
+    cache_path = None
+    if cache_dir is not None:
+        key = _terraform_graph_cache_key(Path.cwd())
+        if key is not None:
+            cache_path = cache_dir / f"{key}.dot"
+            try:
+                dot_text = cache_path.read_text(encoding="utf-8")
+                os.utime(cache_path)
+                return dot_text
+            except OSError:
+                pass
+
     try:
         proc = subprocess.run(
             ["terraform", "graph"],
@@ -828,6 +1161,12 @@ def _auto_run_terraform_graph() -> Optional[str]:
             timeout=30,
         )
         if proc.returncode == 0 and proc.stdout.strip():
+            if cache_path is not None:
+                try:
+                    _write_atomic(cache_path, proc.stdout)
+                    _prune_cache_dir(cache_dir, "*.dot", _CACHE_MAX_ENTRIES)
+                except OSError:
+                    pass  # Non-critical: the graph is still returned
             return proc.stdout
     except (subprocess.TimeoutExpired, OSError):
         pass
@@ -886,6 +1225,12 @@ def _auto_run_terraform_graph() -> Optional[str]:
     help="Fix history match strictness: strict, balanced, or loose.",
 )
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
+@click.option("--pretty", is_flag=True, default=False,
+              help="Indent JSON output (with --format json).")
+@click.option("--no-graph-cache", "no_graph_cache", is_flag=True, default=False,
+              help="Always re-run `terraform graph` instead of reusing a cached graph.")
+@click.option("--no-cache", "no_cache", is_flag=True, default=False,
+              help="Recompute the analysis instead of reusing a cached result.")
 @click.option("--tag-only", is_flag=True, default=False,
               help="Only show tribal warnings from tag-matched fixes (no text search).")
 @click.option("--max-warnings", "max_warnings", type=int, default=10,
@@ -909,6 +1254,9 @@ def analyze(
     summary: bool,
     match_mode: str,
     verbose: bool,
+    pretty: bool,
+    no_graph_cache: bool,
+    no_cache: bool,
     tag_only: bool,
     max_warnings: int,
     ai_explain: bool,
@@ -938,6 +1286,9 @@ def analyze(
         --summary/-s    Quick summary output
         --match/-m      Fix history match strictness (strict|balanced|loose)
         --verbose/-v    Show detailed output
+        --pretty        Indent JSON output (with --format json)
+        --no-graph-cache  Re-run `terraform graph` even if a cached graph exists
+        --no-cache      Recompute the analysis even if a cached result exists
         --tag-only      Only show tribal warnings from tag-matched fixes
         --max-warnings  Max tribal knowledge warnings to surface (default: 10)
         --ai-explain    Use Claude API for polished score explanation (needs ANTHROPIC_API_KEY)
@@ -949,8 +1300,7 @@ def analyze(
     plan_path = Path(plan_file)
 
     try:
-        with open(plan_path, "r") as f:
-            plan = json.load(f)
+        plan = _load_plan_json(plan_path)
     except json.JSONDecodeError:
         click.echo("Error: Invalid JSON in plan file.", err=True)
         click.echo(
@@ -967,18 +1317,14 @@ def analyze(
         click.echo("No changes to analyze.")
         return
 
-    # Get graph DOT text
-    dot_text = None
-    if graph_file:
-        with open(graph_file, "r") as f:
-            dot_text = f.read()
-    else:
-        dot_text = _auto_run_terraform_graph()
-        if dot_text is None and output_format != "json":
-            click.echo(
-                "Note: terraform not on PATH; running without dependency graph.",
-                err=True,
-            )
+    # Auto-run `terraform graph` on a worker thread so the subprocess overlaps
+    # the outcome query; it is only waited on once the graph is needed
+    graph_future = None
+    if not graph_file:
+        graph_cache_dir = None if no_graph_cache else repo.base_path / "cache" / "graph"
+        executor = ThreadPoolExecutor(max_workers=1)
+        graph_future = executor.submit(_auto_run_terraform_graph, cache_dir=graph_cache_dir)
+        executor.shutdown(wait=False)
 
     # Build change_blocks from plan for fingerprinting
     plan_change_blocks = {}
@@ -1002,13 +1348,38 @@ def analyze(
     except Exception:
         pass  # Non-critical: don't break analysis if outcome store fails
 
-    # Run change impact analysis
-    result = analyze_change_impact(
-        plan, repo, dot_text=dot_text, max_depth=max_depth,
-        tag_only=tag_only, max_resource_warnings=max_warnings,
-        change_blocks=plan_change_blocks,
-        outcome_failure_count=outcome_failure_count,
-    )
+    # Get graph DOT text
+    dot_text = None
+    if graph_file:
+        with open(graph_file, "r") as f:
+            dot_text = f.read()
+    else:
+        dot_text = graph_future.result()
+        if dot_text is None and output_format != "json":
+            click.echo(
+                "Note: terraform not on PATH; running without dependency graph.",
+                err=True,
+            )
+
+    # Run change impact analysis, reusing a recent result for identical inputs
+    result = None
+    impact_cache_path = None
+    if not no_cache:
+        key = _impact_cache_key(
+            plan_path, dot_text, repo, max_depth=max_depth, tag_only=tag_only,
+            max_warnings=max_warnings, outcome_failure_count=outcome_failure_count,
+        )
+        impact_cache_path = repo.base_path / "cache" / "impact" / f"{key}.json"
+        result = _load_cached_impact(impact_cache_path)
+    if result is None:
+        result = analyze_change_impact(
+            plan, repo, dot_text=dot_text, max_depth=max_depth,
+            tag_only=tag_only, max_resource_warnings=max_warnings,
+            change_blocks=plan_change_blocks,
+            outcome_failure_count=outcome_failure_count,
+        )
+        if impact_cache_path is not None:
+            _store_cached_impact(impact_cache_path, result)
     result.outcome_matches = outcome_matches_list
 
     # Filter history matches by match mode
@@ -1084,6 +1455,7 @@ def analyze(
             result,
             plan_fingerprint=plan_fp,
             outcome_id=recorded_outcome_id,
+            pretty=pretty,
         ))
     elif output_format == "markdown":
         click.echo(_format_markdown(result))
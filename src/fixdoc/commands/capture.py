@@ -45,8 +45,12 @@ def _reopen_stdin_from_terminal() -> bool:
     "--tags", "-t", type=str, default=None,
     help="Tags (comma-separated)",
 )
+@click.option(
+    "--editor", "-e", "use_editor", is_flag=True, default=False,
+    help="Fill in all fields in $EDITOR instead of answering prompts",
+)
 @click.pass_context
-def capture(ctx, quick: Optional[str], tags: Optional[str]):
+def capture(ctx, quick: Optional[str], tags: Optional[str], use_editor: bool):
     """
     Capture a new fix.
 
@@ -58,6 +62,10 @@ def capture(ctx, quick: Optional[str], tags: Optional[str]):
     Interactive:
         fixdoc capture
 
+    \b
+    Editor (one form instead of prompts; or set capture.use_editor):
+        fixdoc capture -e
+
     \b
     Quick:
         fixdoc capture -q "issue | resolution" -t storage,rbac
@@ -71,7 +79,9 @@ def capture(ctx, quick: Optional[str], tags: Optional[str]):
     elif quick:
         fix = handle_quick_capture(quick, tags, repo)
     else:
-        fix = handle_interactive_capture(tags, repo)
+        fix = handle_interactive_capture(
+            tags, repo, use_editor=use_editor or config.capture.use_editor,
+        )
 
     if fix:
         # Set author from config if available
@@ -91,7 +101,8 @@ def _handle_piped_input(
     # Read all piped input first
     piped_input = sys.stdin.read()
 
-    if not piped_input.strip():
+    # isspace() checks in place instead of copying a stripped input
+    if not piped_input or piped_input.isspace():
         click.echo("No input received.", err=True)
         return None
 
@@ -1,5 +1,6 @@
 """Capture handlers for different input types."""
 
+import re
 from typing import Optional
 
 import click
@@ -27,6 +28,26 @@ _MEMORY_TYPE_LABELS = {
 
 _TYPE_SHORTHAND = {"f": "fix", "c": "check", "p": "playbook", "i": "insight"}
 
+# Rule printed above and below each captured-error card
+_SEP = "─" * 50
+
+# Form opened in $EDITOR by interactive capture in editor mode
+_EDITOR_TEMPLATE = """\
+# Fill in the fix and save to capture it; lines starting with '#' are ignored.
+# issue and resolution are required. Text after a field name is taken as is
+# and may continue onto the following lines, up to the next field name.
+issue:
+resolution:
+error_excerpt:
+tags: {tags}
+notes:
+"""
+
+_EDITOR_FIELDS = ("issue", "resolution", "error_excerpt", "tags", "notes")
+
+# A line that starts a field in the editor form, e.g. "issue: ..."
+_EDITOR_FIELD_RE = re.compile(r"^(%s):(.*)$" % "|".join(_EDITOR_FIELDS))
+
 
 def _classify_and_confirm(resolution: str) -> str:
     """Auto-classify memory type. Only prompt override for non-fix types."""
@@ -49,6 +70,61 @@ def _classify_and_confirm(resolution: str) -> str:
     return detected
 
 
+def _parse_editor_form(text: str) -> dict:
+    """Split a saved editor form into fix fields.
+
+    Each field runs from its `name:` header to the next header, and its text
+    is kept literally (no YAML typing, so "Error: ..." or "yes" stay as
+    written). Raises ValueError on text outside any field, a repeated field,
+    or an empty issue or resolution.
+    """
+    values: dict[str, list[str]] = {key: [] for key in _EDITOR_FIELDS}
+    seen = set()
+    current = None
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = _EDITOR_FIELD_RE.match(line)
+        if match:
+            current = match.group(1)
+            if current in seen:
+                raise ValueError(f"'{current}' appears more than once")
+            seen.add(current)
+            values[current].append(match.group(2))
+        elif current is not None:
+            values[current].append(line)
+        elif line.strip():
+            raise ValueError(f"text before the first field: {line.strip()[:40]!r}")
+
+    fields = {key: "\n".join(lines).strip() for key, lines in values.items()}
+    missing = [key for key in ("issue", "resolution") if not fields[key]]
+    if missing:
+        raise ValueError(f"{' and '.join(missing)} required")
+    return fields
+
+
+def _capture_via_editor(template: str) -> Optional[dict]:
+    """Open template in $EDITOR and return the fix fields saved in it.
+
+    If the saved form can't be read, offers to re-open the editor on the
+    user's text so nothing typed is lost. Returns None if the editor was
+    closed without saving or the user gives up.
+    """
+    text = template
+    while True:
+        text = click.edit(text=text, extension=".txt")
+        if text is None:
+            click.echo("Editor closed without saving; nothing captured.", err=True)
+            return None
+        try:
+            return _parse_editor_form(text)
+        except ValueError as e:
+            click.echo(f"Could not read the form: {e}", err=True)
+        if not click.confirm("Re-open the editor to fix it?", default=True):
+            click.echo("Nothing captured.", err=True)
+            return None
+
+
 def _excerpt_limit(config: Optional[FixDocConfig] = None) -> int:
     """Return the error excerpt max chars from config or default."""
     if config:
@@ -70,6 +146,14 @@ def _similar_fix_limit(config: Optional[FixDocConfig] = None) -> int:
     return 5
 
 
+def _auto_tags(err: ParsedError, tags: Optional[str]) -> str:
+    """Return the error's generated tags, with any user-supplied tags appended."""
+    auto_tags = err.generate_tags()
+    if tags:
+        auto_tags = f"{auto_tags},{tags}"
+    return auto_tags
+
+
 def get_similar_fixes_for_error(
     err: ParsedError,
     tags: Optional[str],
@@ -79,9 +163,7 @@ def get_similar_fixes_for_error(
     """Find similar fixes for a parsed error without prompting."""
     if not repo:
         return []
-    auto_tags = err.generate_tags()
-    if tags:
-        auto_tags = f"{auto_tags},{tags}"
+    auto_tags = _auto_tags(err, tags)
     return find_similar_fixes(
         repo, err.raw_output, auto_tags, limit=_similar_fix_limit(config)
     )
@@ -102,7 +184,7 @@ def capture_single_error(
     max_suggestions = _suggestions_limit(config)
 
     # Display captured error info
-    click.echo("─" * 50)
+    click.echo(_SEP)
     click.echo("Captured from Terraform:\n")
     click.echo(f"  Provider: {err.cloud_provider.value.upper()}")
     click.echo(f"  Resource: {err.resource_address}")
@@ -118,15 +200,16 @@ def capture_single_error(
         for suggestion in err.suggestions[:max_suggestions]:
             click.echo(f"    • {suggestion}")
 
-    click.echo("─" * 50)
+    click.echo(_SEP)
+
+    # Generated once; used for the similar-fix lookup and the Tags prompt
+    auto_tags = _auto_tags(err, tags)
 
     # Check for similar existing fixes before prompting for resolution
     if repo:
-        auto_tags = err.generate_tags()
-        if tags:
-            auto_tags = f"{auto_tags},{tags}"
         existing_fix = prompt_similar_fixes(
             repo, output, auto_tags, limit=_similar_fix_limit(config),
+            parsed_error=err,
         )
         if existing_fix:
             click.echo(f"\n Using existing fix: {existing_fix.id[:8]}")
@@ -137,11 +220,6 @@ def capture_single_error(
     resolution = click.prompt("\n What fixed this?")
     issue = err.to_issue_string()
 
-    # Auto-generate tags
-    auto_tags = err.generate_tags()
-    if tags:
-        auto_tags = f"{auto_tags},{tags}"
-
     final_tags = click.prompt("Tags", default=auto_tags, show_default=True)
 
     # Optional notes
@@ -176,13 +254,11 @@ def capture_single_k8s_error(
     max_suggestions = _suggestions_limit(config)
 
     # Display captured error info
-    click.echo("─" * 50)
+    click.echo(_SEP)
 
     # Determine source label
-    if hasattr(err, 'helm_release') and err.helm_release:
-        source_label = "Helm"
-    else:
-        source_label = "Kubernetes"
+    is_k8s = isinstance(err, KubernetesError)
+    source_label = "Helm" if is_k8s and err.helm_release else "Kubernetes"
 
     click.echo(f"Captured from {source_label}:\n")
 
@@ -192,7 +268,7 @@ def capture_single_k8s_error(
         click.echo(f"  Resource:  {err.resource_type}/{err.resource_name or 'unknown'}")
 
     # Kubernetes-specific fields
-    if isinstance(err, KubernetesError):
+    if is_k8s:
         if err.helm_release:
             click.echo(f"  Release:   {err.helm_release}")
         if err.helm_chart:
@@ -214,15 +290,16 @@ def capture_single_k8s_error(
         for suggestion in err.suggestions[:max_suggestions]:
             click.echo(f"    • {suggestion}")
 
-    click.echo("─" * 50)
+    click.echo(_SEP)
+
+    # Generated once; used for the similar-fix lookup and the Tags prompt
+    auto_tags = _auto_tags(err, tags)
 
     # Check for similar existing fixes before prompting for resolution
     if repo:
-        auto_tags = err.generate_tags()
-        if tags:
-            auto_tags = f"{auto_tags},{tags}"
         existing_fix = prompt_similar_fixes(
             repo, output, auto_tags, limit=_similar_fix_limit(config),
+            parsed_error=err,
         )
         if existing_fix:
             click.echo(f"\n Using existing fix: {existing_fix.id[:8]}")
@@ -233,16 +310,11 @@ def capture_single_k8s_error(
     resolution = click.prompt("\n What fixed this?")
     issue = err.to_issue_string()
 
-    # Auto-generate tags
-    auto_tags = err.generate_tags()
-    if tags:
-        auto_tags = f"{auto_tags},{tags}"
-
     final_tags = click.prompt("Tags", default=auto_tags, show_default=True)
 
     # Optional notes with helpful context
     notes_parts = []
-    if isinstance(err, KubernetesError):
+    if is_k8s:
         if err.namespace:
             notes_parts.append(f"Namespace: {err.namespace}")
         if err.pod_name:
@@ -277,10 +349,14 @@ def handle_piped_input(
     """
     source = detect_error_source(output)
 
+    # Parse with the detected source so the output is only scanned for
+    # detection once
     if source == ErrorSource.TERRAFORM:
-        return handle_terraform_capture(output, tags, repo, config=config)
+        errors = detect_and_parse(output, source=source)
+        return handle_terraform_capture(output, tags, repo, config=config, errors=errors)
     elif source in (ErrorSource.KUBERNETES, ErrorSource.HELM):
-        return handle_kubernetes_capture(output, tags, repo, config=config)
+        errors = detect_and_parse(output, source=source)
+        return handle_kubernetes_capture(output, tags, repo, config=config, errors=errors)
     else:
         return handle_generic_piped_capture(output, tags, repo, config=config)
 
@@ -288,9 +364,14 @@ def handle_piped_input(
 def handle_terraform_capture(
     output: str, tags: Optional[str], repo: Optional[FixRepository] = None,
     config: Optional[FixDocConfig] = None,
+    errors: Optional[list[ParsedError]] = None,
 ) -> Optional[Fix]:
-    """Handle Terraform output with multi-cloud support."""
-    errors = detect_and_parse(output) # this detects all the errors and returns them as a list
+    """Handle Terraform output with multi-cloud support.
+
+    errors, when given, is the already-parsed output and is used as is.
+    """
+    if errors is None:
+        errors = detect_and_parse(output) # this detects all the errors and returns them as a list
 
     if not errors:
         click.echo("No Terraform errors found in input", err=True)
@@ -309,9 +390,14 @@ def handle_terraform_capture(
 def handle_kubernetes_capture(
     output: str, tags: Optional[str], repo: Optional[FixRepository] = None,
     config: Optional[FixDocConfig] = None,
+    errors: Optional[list[ParsedError]] = None,
 ) -> Optional[Fix]:
-    """Handle Kubernetes (kubectl/Helm) output."""
-    errors = detect_and_parse(output)
+    """Handle Kubernetes (kubectl/Helm) output.
+
+    errors, when given, is the already-parsed output and is used as is.
+    """
+    if errors is None:
+        errors = detect_and_parse(output)
 
     if not errors:
         click.echo("No Kubernetes errors found in input", err=True)
@@ -332,9 +418,9 @@ def handle_generic_piped_capture(
     config: Optional[FixDocConfig] = None,
 ) -> Optional[Fix]:
     """Handle generic piped input - treat as error excerpt."""
-    click.echo("─" * 50)
+    click.echo(_SEP)
     click.echo("Captured generic input (unknown source)")
-    click.echo("─" * 50)
+    click.echo(_SEP)
 
     # Check for similar existing fixes before prompting for details
     if repo:
@@ -394,12 +480,20 @@ def handle_quick_capture(
 
 
 def handle_interactive_capture(
-    tags: Optional[str], repo: Optional[FixRepository] = None
+    tags: Optional[str], repo: Optional[FixRepository] = None,
+    use_editor: bool = False,
 ) -> Optional[Fix]:
-    """Handle interactive capture mode."""
-    click.echo("─" * 50)
+    """Handle interactive capture mode.
+
+    With use_editor, every field is filled in one $EDITOR session instead
+    of a prompt per field.
+    """
+    if use_editor:
+        return _handle_editor_capture(tags, repo)
+
+    click.echo(_SEP)
     click.echo("Capturing a new fix...")
-    click.echo("─" * 50)
+    click.echo(_SEP)
     click.echo()
 
     issue = click.prompt("What was the issue?")
@@ -433,3 +527,33 @@ def handle_interactive_capture(
         notes=notes or None,
         memory_type=memory_type,
     )
+
+
+def _handle_editor_capture(
+    tags: Optional[str], repo: Optional[FixRepository] = None
+) -> Optional[Fix]:
+    """Collect a new fix from a single editor form."""
+    fields = _capture_via_editor(_EDITOR_TEMPLATE.format(tags=tags or ""))
+    if fields is None:
+        return None
+
+    tags = fields["tags"] or None
+
+    # Check for similar existing fixes now that the issue is known
+    if repo:
+        existing_fix = prompt_similar_fixes(repo, fields["issue"], tags)
+        if existing_fix:
+            click.echo(f"\n Using existing fix: {existing_fix.id[:8]}")
+            click.echo(f"  Resolution: {existing_fix.resolution[:80]}...")
+            return None  # Don't create a new fix
+
+    memory_type = _classify_and_confirm(fields["resolution"])
+
+    return Fix(
+        issue=fields["issue"],
+        resolution=fields["resolution"],
+        error_excerpt=fields["error_excerpt"] or None,
+        tags=tags,
+        notes=fields["notes"] or None,
+        memory_type=memory_type,
+    )
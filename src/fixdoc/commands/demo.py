@@ -1,18 +1,10 @@
 """Demo commands for fixdoc — seed sample data and interactive tour."""
 
-import json
-import os
-import tempfile
+from collections import Counter
+from operator import attrgetter
 
 import click
 
-from ..demo_data import (
-    DEMO_TAG,
-    SAMPLE_TERRAFORM_PLAN,
-    TERRAFORM_AWS_ERROR,
-    KUBERNETES_CRASHLOOP_ERROR,
-    get_seed_fixes,
-)
 from ..storage import FixRepository
 from .capture_handlers import handle_piped_input
 
@@ -34,14 +26,14 @@ def demo(ctx):
 @click.pass_context
 def seed(ctx, clean: bool):
     """Populate the fix database with realistic sample fixes."""
+    from ..demo_data import get_seed_fixes
+
     repo = FixRepository(ctx.obj["base_path"])
 
     if clean:
         _clean_demo_fixes(repo)
 
-    fixes = get_seed_fixes()
-    for fix in fixes:
-        repo.save(fix)
+    fixes = repo.save_many(get_seed_fixes())
 
     click.echo(f"Seeded {len(fixes)} demo fixes:")
     for fix in fixes:
@@ -53,12 +45,11 @@ def seed(ctx, clean: bool):
 
 def _clean_demo_fixes(repo: FixRepository) -> None:
     """Remove all fixes tagged with the demo tag."""
-    all_fixes = repo.list_all()
-    removed = 0
-    for fix in all_fixes:
-        if fix.tags and DEMO_TAG in [t.strip() for t in fix.tags.split(",")]:
-            repo.delete(fix.id)
-            removed += 1
+    from ..demo_data import DEMO_TAG
+
+    removed = repo.delete_many(
+        fix.id for fix in repo.iter_all() if DEMO_TAG in fix.tag_list
+    )
     if removed:
         click.echo(f"Removed {removed} previous demo fix(es).")
 
@@ -67,6 +58,12 @@ def _clean_demo_fixes(repo: FixRepository) -> None:
 @click.pass_context
 def tour(ctx):
     """Interactive guided walkthrough of fixdoc's capture flow."""
+    from ..demo_data import (
+        KUBERNETES_CRASHLOOP_ERROR,
+        SAMPLE_TERRAFORM_PLAN,
+        TERRAFORM_AWS_ERROR,
+    )
+
     config = ctx.obj.get("config")
     repo = FixRepository(ctx.obj["base_path"])
 
@@ -139,7 +136,9 @@ def tour(ctx):
     click.echo()
     click.echo('Searching for "S3"...\n')
 
-    results = repo.search("S3")
+    # Steps 3 and 4 share one read of the database; nothing is saved between them
+    all_fixes = repo.list_all()
+    results = [f for f in all_fixes if f.matches("S3")]
     if results:
         for fix in results:
             click.echo(f"  {fix.summary()}")
@@ -153,25 +152,17 @@ def tour(ctx):
     click.echo("=" * 56)
     click.echo()
 
-    all_fixes = repo.list_all()
-    all_fixes.sort(key=lambda f: f.created_at, reverse=True)
+    all_fixes.sort(key=attrgetter("created_at"), reverse=True)
     click.echo(f"Total fixes: {len(all_fixes)}\n")
     for fix in all_fixes[:10]:
         click.echo(f"  {fix.summary()}")
 
     # Quick stats
-    all_tags: list[str] = []
-    for fix in all_fixes:
-        if fix.tags:
-            all_tags.extend([t.strip() for t in fix.tags.split(",")])
-    tag_counts: dict[str, int] = {}
-    for tag in all_tags:
-        tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tag_counts = Counter(t for fix in all_fixes for t in fix.tag_list)
 
     if tag_counts:
         click.echo("\nTop tags:")
-        sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-        for tag, count in sorted_tags[:5]:
+        for tag, count in tag_counts.most_common(5):
             click.echo(f"  {tag}: {count}")
     click.echo()
 
@@ -195,18 +186,9 @@ def tour(ctx):
     try:
         from .analyze import TerraformAnalyzer
 
-        fd, plan_path = tempfile.mkstemp(suffix=".json", prefix="fixdoc_demo_plan_")
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(SAMPLE_TERRAFORM_PLAN, f)
-
-            from pathlib import Path
-
-            analyzer = TerraformAnalyzer(repo=repo)
-            output = analyzer.analyze_and_format(Path(plan_path))
-            click.echo(output)
-        finally:
-            os.unlink(plan_path)
+        analyzer = TerraformAnalyzer(repo=repo)
+        output = analyzer.analyze_plan_and_format(SAMPLE_TERRAFORM_PLAN)
+        click.echo(output)
     except Exception as e:
         click.echo(f"  (analyze step skipped: {e})")
     click.echo()
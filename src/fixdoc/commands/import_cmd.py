@@ -1,4 +1,8 @@
-"""Import command — import closed fixes from Jira, ServiceNow, Notion, or Slack."""
+"""Import command — import closed fixes from Jira, ServiceNow, Notion, or Slack.
+
+Each source's importer module is imported inside its command, so other
+fixdoc commands don't pay for urllib/http.client at startup.
+"""
 
 from pathlib import Path
 from typing import Optional
@@ -7,7 +11,6 @@ import click
 
 from ..classifier import MEMORY_TYPES, classify_memory_type
 from ..importers.base import ImportResult, is_high_signal, parse_csv, parse_json
-from ..importers import jira, servicenow, notion, slack
 from ..storage import FixRepository
 
 _TYPE_SHORTHAND = {"f": "fix", "c": "check", "p": "playbook", "i": "insight"}
@@ -375,6 +378,8 @@ def jira_import(ctx, file, closed, auto, dry_run, max_rows, extra_tags):
         fixdoc import jira issues.csv --closed --auto
         fixdoc import jira backup.json --closed --dry-run
     """
+    from ..importers import jira
+
     path = Path(file)
     extra = _parse_extra_tags(extra_tags)
 
@@ -460,6 +465,8 @@ def snow_import(
         fixdoc import servicenow incidents.json --closed --auto
         fixdoc import servicenow incidents.json --allow-description-as-resolution
     """
+    from ..importers import servicenow
+
     path = Path(file)
     extra = _parse_extra_tags(extra_tags)
 
@@ -558,6 +565,8 @@ def notion_cmd(
     extra_tags,
 ):
     """Import fixes from a Notion database via the Notion API."""
+    from ..importers import notion
+
     extra = _parse_extra_tags(extra_tags)
 
     click.echo("[import] Fetching pages from Notion database ...")
@@ -674,6 +683,8 @@ def slack_import(
         fixdoc import slack --token $SLACK_TOKEN --channel-name terraform-help --dry-run
         fixdoc import slack --token $SLACK_TOKEN --channel C01 --channel C02
     """
+    from ..importers import slack
+
     extra = _parse_extra_tags(extra_tags)
 
     # Resolve channel names to IDs
@@ -3,7 +3,6 @@
 Record apply results, list and inspect outcomes.
 """
 
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,6 +11,7 @@ from typing import Optional
 import click
 
 from ..outcomes import Outcome, OutcomeStore, compute_plan_fingerprint
+from .analyze import _load_plan_json
 
 
 @click.group()
@@ -86,8 +86,7 @@ def record_apply(
     # Resolve fingerprint
     fp = fingerprint
     if fp is None and plan_file is not None:
-        with open(plan_file, "r") as f:
-            plan = json.load(f)
+        plan = _load_plan_json(plan_file)
         fp = compute_plan_fingerprint(plan)
 
     # Resolve error text
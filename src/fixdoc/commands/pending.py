@@ -8,6 +8,9 @@ from ..pending import PendingStore
 from ..storage import FixRepository
 from .capture_handlers import handle_piped_input
 
+# Rule under the pending-list header; spans the table's columns
+_ROW_SEP = "─" * 95
+
 
 @click.group(invoke_without_command=True)
 @click.option("--all", "show_all", is_flag=True, default=False,
@@ -22,43 +25,49 @@ def pending(ctx, show_all):
         _list_pending(show_all=show_all)
 
 
+def _format_pending_row(i: int, entry) -> str:
+    """Format one row of the pending-errors table."""
+    resource = entry.resource_address or "—"
+    if len(resource) > 30:
+        resource = resource[:27] + "..."
+    code = entry.error_code or "—"
+    if len(code) > 20:
+        code = code[:17] + "..."
+    # Show date portion only
+    deferred = entry.deferred_at[:19] if entry.deferred_at else "—"
+    return f"{i:>3}  {entry.error_id:<14}  {resource:<30}  {code:<20}  {deferred}"
+
+
 def _list_pending(show_all: bool = False) -> None:
     """List all pending errors."""
     store = PendingStore()
-    entries = store.list_all(include_self_explanatory=show_all)
+    # One read of the pending file; hidden entries are filtered out here
+    all_entries = store.list_all(include_self_explanatory=True)
+    if show_all:
+        entries = all_entries
+    else:
+        entries = [e for e in all_entries if e.worthiness != "self_explanatory"]
 
     if not entries:
-        if not show_all:
-            all_entries = store.list_all(include_self_explanatory=True)
-            if all_entries:
-                click.echo(f"No pending errors ({len(all_entries)} self-explanatory hidden. Use --all to show).")
-                return
+        if not show_all and all_entries:
+            click.echo(f"No pending errors ({len(all_entries)} self-explanatory hidden. Use --all to show).")
+            return
         click.echo("No pending errors.")
         return
 
-    click.echo(f"\n{'#':>3}  {'Error ID':<14}  {'Resource':<30}  {'Code':<20}  {'Deferred At'}")
-    click.echo("─" * 95)
-
     entries.sort(key=lambda e: e.deferred_at or "", reverse=True)
 
-    for i, entry in enumerate(entries, 1):
-        resource = entry.resource_address or "—"
-        if len(resource) > 30:
-            resource = resource[:27] + "..."
-        code = entry.error_code or "—"
-        if len(code) > 20:
-            code = code[:17] + "..."
-        # Show date portion only
-        deferred = entry.deferred_at[:19] if entry.deferred_at else "—"
-        click.echo(f"{i:>3}  {entry.error_id:<14}  {resource:<30}  {code:<20}  {deferred}")
-
-    if not show_all:
-        all_count = len(store.list_all(include_self_explanatory=True))
-        hidden = all_count - len(entries)
-        if hidden:
-            click.echo(f"\n{len(entries)} pending error(s) ({hidden} self-explanatory hidden).\n")
-        else:
-            click.echo(f"\n{len(entries)} pending error(s).\n")
+    # Emit the whole table in one write
+    rows = [
+        f"\n{'#':>3}  {'Error ID':<14}  {'Resource':<30}  {'Code':<20}  {'Deferred At'}",
+        _ROW_SEP,
+    ]
+    rows.extend(_format_pending_row(i, entry) for i, entry in enumerate(entries, 1))
+    click.echo("\n".join(rows))
+
+    hidden = len(all_entries) - len(entries)
+    if hidden:
+        click.echo(f"\n{len(entries)} pending error(s) ({hidden} self-explanatory hidden).\n")
     else:
         click.echo(f"\n{len(entries)} pending error(s).\n")
 
@@ -124,14 +133,16 @@ def pending_remove(error_id_or_number):
 
 def _resolve_entry(store: PendingStore, id_or_number: str) -> Optional:
     """Resolve an entry by list number (1-based) or error_id prefix."""
+    # Read the pending file once for both lookups
+    entries = store.list_all()
+
     # Try as number first
     try:
         num = int(id_or_number)
-        entries = store.list_all()
         if 1 <= num <= len(entries):
             return entries[num - 1]
     except ValueError:
         pass
 
-    # Try as error_id prefix
-    return store.get(id_or_number)
+    # Try as error_id prefix (first match in list order, as PendingStore.get)
+    return next((e for e in entries if e.error_id.startswith(id_or_number)), None)
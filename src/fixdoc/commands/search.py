@@ -31,27 +31,32 @@ def search(ctx, query: str, limit: int, tag_filter: str, any_tags: bool, match_a
     limit = limit if limit is not None else config.display.search_result_limit
 
     repo = FixRepository(ctx.obj["base_path"])
-    all_fixes = repo.list_all()
-
-    # Filter by query (multi-word AND or OR)
-    results = [f for f in all_fixes if f.matches(query, match_any=match_any)]
-
-    # Filter by tags if provided
-    if tag_filter:
-        required_tags = [t.strip() for t in tag_filter.split(",") if t.strip()]
-        results = [f for f in results if f.matches_tags(required_tags, match_any=any_tags)]
-
-    if not results:
+    required_tags = (
+        [t.strip() for t in tag_filter.split(",") if t.strip()] if tag_filter else None
+    )
+
+    # Single streaming pass: query filter (multi-word AND or OR), then tags if
+    # provided. Only the first `limit` matches are kept; the rest are counted.
+    shown = []
+    total = 0
+    for fix in repo.iter_matching(query, match_any=match_any):
+        if required_tags is not None and not fix.matches_tags(required_tags, match_any=any_tags):
+            continue
+        total += 1
+        if len(shown) < limit:
+            shown.append(fix)
+
+    if not total:
         click.echo(f"No fixes found matching '{query}'")
         return
 
-    click.echo(f"Found {len(results)} fix(es) matching '{query}':\n")
+    click.echo(f"Found {total} fix(es) matching '{query}':\n")
 
-    for fix in results[:limit]:
+    for fix in shown:
         click.echo(f"  {fix.summary()}")
 
-    if len(results) > limit:
-        click.echo(f"\n  ... and {len(results) - limit} more. Use --limit to see more.")
+    if total > limit:
+        click.echo(f"\n  ... and {total - limit} more. Use --limit to see more.")
 
     click.echo(f"\nRun `fixdoc show <fix-id>` for full details.")
 
@@ -1,5 +1,6 @@
 """Watch command — wraps a command and captures errors on failure."""
 
+import codecs
 import os
 import subprocess
 import sys
@@ -28,6 +29,14 @@ from .capture_handlers import (
 )
 from ._resolve_flow import resolve_pending_entries
 
+# Max bytes taken from the child's output pipe per read
+_READ_CHUNK = 1 << 16
+
+# Captured output keeps at least this much of the tail, and at most twice
+# it, so a long-running command can't grow the buffer without bound.
+# Errors are reported at the end of the output, which is what gets parsed.
+_CAPTURE_TAIL_BYTES = 2 << 20
+
 # Patterns that indicate a non-error exit (user cancelled, etc.)
 _CANCELLED_PATTERNS = [
     "Apply cancelled.",
@@ -96,6 +105,11 @@ def _show_fix_suggestions_list(entries, repo, limit_per_error=2, max_total=6):
     """
     seen_fix_ids = set()
     suggestions = []
+    if not entries:
+        return suggestions
+
+    # One database read shared by every entry's lookup
+    all_fixes = repo.list_all()
 
     for entry in entries:
         matches = find_similar_fixes(
@@ -105,6 +119,7 @@ def _show_fix_suggestions_list(entries, repo, limit_per_error=2, max_total=6):
             limit=limit_per_error,
             resource_address=entry.resource_address,
             error_id=entry.error_id,
+            fixes=all_fixes,
         )
         label = entry.resource_address or entry.short_message[:60]
         code = f" ({entry.error_code})" if entry.error_code else ""
@@ -255,16 +270,32 @@ def watch(ctx, command, tags, no_prompt, diagnose, notify):
     session_id = uuid.uuid4().hex[:8]
     family = _command_family(command_str)
 
-    captured_output = []
+    captured_output = bytearray()
 
     def _reader(pipe):
-        """Read from pipe, display to terminal, and buffer output."""
+        """Copy pipe to the terminal as chunks arrive and buffer the output's tail.
+
+        read1 returns whatever is already available (up to _READ_CHUNK), so
+        output streams without a decode, write and flush per line. Bytes go
+        straight to the terminal; only a text-only stdout needs decoding.
+        """
+        out = getattr(sys.stdout, "buffer", None)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         try:
-            for line in iter(pipe.readline, b""):
-                decoded = line.decode("utf-8", errors="replace")
-                sys.stdout.write(decoded)
-                sys.stdout.flush()
-                captured_output.append(decoded)
+            for chunk in iter(lambda: pipe.read1(_READ_CHUNK), b""):
+                if out is not None:
+                    out.write(chunk)
+                    out.flush()
+                else:
+                    sys.stdout.write(decoder.decode(chunk))
+                    sys.stdout.flush()
+                captured_output.extend(chunk)
+                if len(captured_output) > 2 * _CAPTURE_TAIL_BYTES:
+                    # Trimming only at 2x amortizes the shift; cut on a line
+                    # boundary so the kept tail starts with a whole line
+                    start = len(captured_output) - _CAPTURE_TAIL_BYTES
+                    cut = captured_output.find(b"\n", start)
+                    del captured_output[:cut + 1 if cut != -1 else start]
         except ValueError:
             pass
         finally:
@@ -280,6 +311,9 @@ def watch(ctx, command, tags, no_prompt, diagnose, notify):
         click.echo(f"Command not found: {command[0]}", err=True)
         sys.exit(127)
 
+    # Anything already written as text must reach the terminal before the
+    # reader starts writing bytes underneath it
+    sys.stdout.flush()
     reader_thread = threading.Thread(target=_reader, args=(proc.stdout,))
     reader_thread.daemon = True
     reader_thread.start()
@@ -290,7 +324,7 @@ def watch(ctx, command, tags, no_prompt, diagnose, notify):
     exit_code = proc.returncode
 
     if exit_code != 0:
-        output_text = "".join(captured_output).strip()
+        output_text = captured_output.decode("utf-8", errors="replace").strip()
 
         if not output_text:
             sys.exit(exit_code)
@@ -376,7 +410,11 @@ def watch(ctx, command, tags, no_prompt, diagnose, notify):
             click.echo("I'll ask what fixed these on your next successful run.")
             click.echo("[c] capture one now  [s] skip")
 
-            choice = click.prompt("", default="s", show_default=False).strip().lower()
+            # Choice re-prompts on a typo rather than silently skipping
+            choice = click.prompt(
+                "", default="s", show_default=False, show_choices=False,
+                type=click.Choice(["c", "s"], case_sensitive=False),
+            )
 
             if choice == "c":
                 click.echo("\nWhich error?")
@@ -384,34 +422,35 @@ def watch(ctx, command, tags, no_prompt, diagnose, notify):
                     resource = entry.resource_address or entry.short_message[:60]
                     code = f" ({entry.error_code})" if entry.error_code else ""
                     click.echo(f"  {i}. {resource}{code}")
-                idx = click.prompt("Error number", type=int, default=1)
-                if 1 <= idx <= len(memory_worthy):
-                    selected_entry = memory_worthy[idx - 1]
-                    if not errors or selected_entry.error_type == "generic":
+                idx = click.prompt(
+                    "Error number", type=click.IntRange(1, len(memory_worthy)), default=1,
+                )
+                selected_entry = memory_worthy[idx - 1]
+                if not errors or selected_entry.error_type == "generic":
+                    fix = handle_piped_input(
+                        selected_entry.error_excerpt,
+                        tags=tags,
+                        repo=repo,
+                        config=config,
+                    )
+                else:
+                    matching_err = next(
+                        (e for e in errors if e.error_id == selected_entry.error_id),
+                        None,
+                    )
+                    if matching_err:
+                        fix = _capture_error_for_watch(matching_err, tags, repo, config)
+                    else:
                         fix = handle_piped_input(
                             selected_entry.error_excerpt,
                             tags=tags,
                             repo=repo,
                             config=config,
                         )
-                    else:
-                        matching_err = next(
-                            (e for e in errors if e.error_id == selected_entry.error_id),
-                            None,
-                        )
-                        if matching_err:
-                            fix = _capture_error_for_watch(matching_err, tags, repo, config)
-                        else:
-                            fix = handle_piped_input(
-                                selected_entry.error_excerpt,
-                                tags=tags,
-                                repo=repo,
-                                config=config,
-                            )
-                    if fix:
-                        repo.save(fix)
-                        store.remove(selected_entry.error_id)
-                        click.echo(f"Fix saved: {fix.id[:8]}")
+                if fix:
+                    repo.save(fix)
+                    store.remove(selected_entry.error_id)
+                    click.echo(f"Fix saved: {fix.id[:8]}")
 
         sys.exit(exit_code)
 
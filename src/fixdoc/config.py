@@ -7,6 +7,11 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 def resolve_base_path() -> Path:
     """Resolve the fixdoc base path.
@@ -52,6 +57,7 @@ class CaptureConfig:
     error_excerpt_max_chars: int = 2000
     max_suggestions_shown: int = 3
     similar_fix_limit: int = 5
+    use_editor: bool = False
 
 
 @dataclass
@@ -120,7 +126,7 @@ class FixDocConfig:
         display_data = data.get("display", {})
         capture_data = data.get("capture", {})
         weights_data = data.get("suggestion_weights", {})
-        private_fixes = data.get("private_fixes", [])
+        private_fixes = list(data.get("private_fixes") or [])
 
         diagnosis_data = data.get("diagnosis", {})
         notification_data = data.get("notification", {})
@@ -144,6 +150,7 @@ class FixDocConfig:
                 error_excerpt_max_chars=capture_data.get("error_excerpt_max_chars", 2000),
                 max_suggestions_shown=capture_data.get("max_suggestions_shown", 3),
                 similar_fix_limit=capture_data.get("similar_fix_limit", 5),
+                use_editor=capture_data.get("use_editor", False),
             ),
             suggestion_weights=SuggestionWeights(
                 resource_address_weight=weights_data.get("resource_address_weight", 25),
@@ -177,26 +184,45 @@ class ConfigManager:
     def __init__(self, base_path: Optional[Path] = None):
         self.base_path = base_path or resolve_base_path()
         self.config_path = self.base_path / self.CONFIG_FILE
+        # (mtime_ns, size) of config.yaml and the YAML data parsed from it
+        self._cached: Optional[tuple[tuple[int, int], dict]] = None
 
     def load(self) -> FixDocConfig:
-        """Load config from YAML, create with defaults if not exists."""
-        if not self.config_path.exists():
+        """Load config from YAML, create with defaults if not exists.
+
+        The parsed YAML is kept until config.yaml's mtime or size changes,
+        so repeated loads skip the parse. Each call still returns a fresh
+        FixDocConfig that callers may mutate.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             config = FixDocConfig()
             self.save(config)
             return config
 
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._cached is not None and self._cached[0] == stamp:
+            return FixDocConfig.from_dict(self._cached[1])
+
         try:
             with open(self.config_path, "r") as f:
-                data = yaml.safe_load(f) or {}
-            return FixDocConfig.from_dict(data)
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+            config = FixDocConfig.from_dict(data)
         except (yaml.YAMLError, IOError):
             return FixDocConfig()
+        self._cached = (stamp, data)
+        return config
 
     def save(self, config: FixDocConfig) -> None:
         """Save config to YAML."""
         self.base_path.mkdir(parents=True, exist_ok=True)
         with open(self.config_path, "w") as f:
-            yaml.safe_dump(config.to_dict(), f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                config.to_dict(), f, Dumper=_YamlDumper,
+                default_flow_style=False, sort_keys=False,
+            )
+        self._cached = None
 
     def is_sync_configured(self) -> bool:
         """Check if sync has been initialized."""
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 import uuid
 
@@ -11,6 +12,34 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=4096)
+def split_tags(tags: str) -> tuple[str, ...]:
+    """Split a comma-separated tag string into stripped, non-empty tags.
+
+    Memoized on the string itself rather than cached on Fix, since tags can be
+    edited in place; many fixes also share identical tag strings.
+    """
+    return tuple(t for t in (t.strip() for t in tags.split(",")) if t)
+
+
+# Fix fields that keyword search looks in
+SEARCH_FIELDS = ("issue", "resolution", "error_excerpt", "tags", "notes")
+
+
+def words_match(words: list[str], texts, match_any: bool = False) -> bool:
+    """Check lowercased query words against texts, substring-wise.
+
+    All words must appear (AND) unless match_any, where one suffices (OR).
+    None entries in texts are skipped.
+    """
+    if not words:
+        return False
+    searchable = " ".join(filter(None, texts)).lower()
+    if match_any:
+        return any(w in searchable for w in words)
+    return all(w in searchable for w in words)
+
+
 @dataclass
 class Fix:
     """
@@ -45,6 +74,11 @@ class Fix:
             return None
         return self.success_count / self.applied_count
 
+    @property
+    def tag_list(self) -> tuple[str, ...]:
+        """Return this fix's tags as a tuple of stripped, non-empty strings."""
+        return split_tags(self.tags) if self.tags else ()
+
     def to_dict(self) -> dict:
         """Convert fix to dictionary for JSON serialization."""
         return asdict(self)
@@ -84,18 +118,11 @@ class Fix:
         By default uses AND matching: all words in the query must appear.
         With match_any=True, uses OR matching: any word suffices.
         """
-        searchable = " ".join(
-            filter(
-                None,
-                [self.issue, self.resolution, self.error_excerpt, self.tags, self.notes],
-            )
-        ).lower()
-        words = query.lower().split()
-        if not words:
-            return False
-        if match_any:
-            return any(w in searchable for w in words)
-        return all(w in searchable for w in words)
+        return words_match(
+            query.lower().split(),
+            [self.issue, self.resolution, self.error_excerpt, self.tags, self.notes],
+            match_any,
+        )
 
     def matches_tags(self, required_tags: list[str], match_any: bool = False) -> bool:
         """Check if this fix has the required tags.
@@ -105,7 +132,7 @@ class Fix:
         """
         if not self.tags:
             return False
-        fix_tags = {t.strip().lower() for t in self.tags.split(",") if t.strip()}
+        fix_tags = {t.lower() for t in self.tag_list}
         required = {t.strip().lower() for t in required_tags if t.strip()}
         if not required:
             return True
@@ -1,6 +1,7 @@
 """Base classes and interfaces for error parsers."""
 
 import hashlib
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -28,6 +29,29 @@ def compute_error_id(
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
 
 
+def compile_indicators(indicators) -> tuple:
+    """Compile (literal, pattern) indicator pairs for matches_any_indicator.
+
+    literal must be a lowercase substring that every match of pattern
+    contains; patterns are compiled case-insensitively.
+    """
+    return tuple((literal, re.compile(pattern, re.IGNORECASE)) for literal, pattern in indicators)
+
+
+def matches_any_indicator(text: str, indicators: tuple) -> bool:
+    """Return True if any compiled indicator pattern matches text.
+
+    Each pattern only runs when its literal occurs in the casefolded text, so
+    a large input is scanned by fast substring checks instead of one
+    case-insensitive regex pass per indicator.
+    """
+    folded = text.casefold()
+    return any(
+        literal in folded and pattern.search(text)
+        for literal, pattern in indicators
+    )
+
+
 class CloudProvider(Enum):
     """Cloud provider enumeration."""
     AWS = "aws"
@@ -13,7 +13,10 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
-from .base import ParsedError, ErrorParser, CloudProvider, ErrorSeverity
+from .base import (
+    ParsedError, ErrorParser, CloudProvider, ErrorSeverity,
+    compile_indicators, matches_any_indicator,
+)
 
 
 class KubernetesErrorType(Enum):
@@ -169,6 +172,28 @@ class KubernetesError(ParsedError):
         self.error_type = "kubernetes"
 
 
+# (literal every match contains, pattern) pairs that mark Kubernetes/Helm output
+_KUBERNETES_INDICATORS = compile_indicators([
+    ("kubectl", r'kubectl\s+(apply|create|delete|get|describe)'),
+    ("helm", r'helm\s+(install|upgrade|rollback|template)'),
+    ("error from server", r'Error from server'),
+    ("error when creating", r'error when creating'),
+    ("installation failed", r'INSTALLATION FAILED'),
+    ("upgrade failed", r'UPGRADE FAILED'),
+    ("imagepullbackoff", r'ImagePullBackOff'),
+    ("crashloopbackoff", r'CrashLoopBackOff'),
+    ("oomkilled", r'OOMKilled'),
+    ("createcontainerconfigerror", r'CreateContainerConfigError'),
+    ("failedscheduling", r'FailedScheduling'),
+    ("pod/", r'pod/[a-z0-9-]+'),
+    ("deployment.apps/", r'deployment\.apps/'),
+    ("service/", r'service/'),
+    ("namespace:", r'namespace:.*\s+\w+'),
+    ("kubectl", r'kubectl.*-n\s+\w+'),
+    (".yaml", r'\.yaml.*error'),
+])
+
+
 class KubernetesParser(ErrorParser):
     """Parser for Kubernetes (kubectl/Helm) errors."""
 
@@ -178,26 +203,7 @@ class KubernetesParser(ErrorParser):
 
     def can_parse(self, text: str) -> bool:
         """Check if text looks like Kubernetes/Helm output."""
-        indicators = [
-            r'kubectl\s+(apply|create|delete|get|describe)',
-            r'helm\s+(install|upgrade|rollback|template)',
-            r'Error from server',
-            r'error when creating',
-            r'INSTALLATION FAILED',
-            r'UPGRADE FAILED',
-            r'ImagePullBackOff',
-            r'CrashLoopBackOff',
-            r'OOMKilled',
-            r'CreateContainerConfigError',
-            r'FailedScheduling',
-            r'pod/[a-z0-9-]+',
-            r'deployment\.apps/',
-            r'service/',
-            r'namespace:.*\s+\w+',
-            r'kubectl.*-n\s+\w+',
-            r'\.yaml.*error',
-        ]
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in indicators)
+        return matches_any_indicator(text, _KUBERNETES_INDICATORS)
 
     def parse(self, text: str) -> list[KubernetesError]:
         """Parse Kubernetes output for all errors."""
@@ -26,6 +26,13 @@ class ErrorSource(Enum):
 _terraform_parser = TerraformParser()
 _kubernetes_parser = KubernetesParser()
 
+# Lowercased substrings that mark Helm output
+_HELM_INDICATORS = (
+    'helm install', 'helm upgrade', 'helm rollback',
+    'installation failed', 'upgrade failed', 'rollback failed',
+    'helm template', 'release "',
+)
+
 
 def detect_error_source(text: str) -> ErrorSource:
     """
@@ -41,12 +48,10 @@ def detect_error_source(text: str) -> ErrorSource:
         detected error source
     """
     # Check for Helm first (subset of Kubernetes)
-    helm_indicators = [
-        'helm install', 'helm upgrade', 'helm rollback',
-        'INSTALLATION FAILED', 'UPGRADE FAILED', 'ROLLBACK FAILED',
-        'helm template', 'release "',
-    ]
-    if any(ind.lower() in text.lower() for ind in helm_indicators):
+    # Lowercase once: piped logs can be megabytes, and each indicator
+    # used to re-lowercase the whole text
+    text_lower = text.lower()
+    if any(ind in text_lower for ind in _HELM_INDICATORS):
         return ErrorSource.HELM
 
     # Check for kubectl/Kubernetes
@@ -60,7 +65,9 @@ def detect_error_source(text: str) -> ErrorSource:
     return ErrorSource.UNKNOWN
 
 
-def detect_and_parse(text: str) -> list[ParsedError]:
+def detect_and_parse(
+    text: str, source: Optional[ErrorSource] = None
+) -> list[ParsedError]:
     """
     Automatically detect the error source and parse the text.
 
@@ -70,11 +77,14 @@ def detect_and_parse(text: str) -> list[ParsedError]:
 
     Args:
         text: The error output text to parse
+        source: Source already detected by detect_error_source, to skip
+            scanning the text a second time
 
     Returns:
         List of ParsedError objects (may be TerraformError or KubernetesError)
     """
-    source = detect_error_source(text)
+    if source is None:
+        source = detect_error_source(text)
 
     if source == ErrorSource.TERRAFORM:
         return _terraform_parser.parse(text)
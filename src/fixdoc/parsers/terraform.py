@@ -11,7 +11,10 @@ import re
 from dataclasses import dataclass
 from typing import Optional
 
-from .base import ParsedError, ErrorParser, CloudProvider, ErrorSeverity
+from .base import (
+    ParsedError, ErrorParser, CloudProvider, ErrorSeverity,
+    compile_indicators, matches_any_indicator,
+)
 
 
 # Cloud provider detection patterns
@@ -73,6 +76,20 @@ class TerraformError(ParsedError):
         super().__post_init__()
 
 
+# (literal every match contains, pattern) pairs that mark Terraform output
+_TERRAFORM_INDICATORS = compile_indicators([
+    ("error:", r'Error:'),
+    ("error:", r'│\s*Error:'),
+    ("aws_", r'aws_\w+\.'),
+    ("azurerm_", r'azurerm_\w+\.'),
+    ("google_", r'google_\w+\.'),
+    (".tf", r'\.tf\s+line\s+\d+'),
+    ("with", r'with\s+\w+\.\w+'),
+    ("plan:", r'Plan:.*to add.*to change.*to destroy'),
+    ("terraform", r'terraform\s+(init|plan|apply)'),
+])
+
+
 class TerraformParser(ErrorParser):
     """Parser for Terraform apply/plan errors."""
 
@@ -82,18 +99,7 @@ class TerraformParser(ErrorParser):
 
     def can_parse(self, text: str) -> bool:
         """Check if text looks like Terraform output."""
-        indicators = [
-            r'Error:',
-            r'│\s*Error:',
-            r'aws_\w+\.',
-            r'azurerm_\w+\.',
-            r'google_\w+\.',
-            r'\.tf\s+line\s+\d+',
-            r'with\s+\w+\.\w+',
-            r'Plan:.*to add.*to change.*to destroy',
-            r'terraform\s+(init|plan|apply)',
-        ]
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in indicators) #regex to determine if we can parse
+        return matches_any_indicator(text, _TERRAFORM_INDICATORS)
 
     def parse(self, text: str) -> list[TerraformError]:
         """Parse Terraform output for all errors."""
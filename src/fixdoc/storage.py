@@ -1,11 +1,12 @@
 """Storage management for fixdoc."""
 
 import json
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .config import resolve_base_path
-from .models import Fix
+from .models import SEARCH_FIELDS, Fix, words_match
 from .formatter import fix_to_markdown
 
 
@@ -70,6 +71,29 @@ class FixRepository:
         self._write_markdown(fix)
         return fix
 
+    def save_many(self, fixes: Iterable[Fix]) -> list[Fix]:
+        """Save several fixes with a single database rewrite.
+
+        Same update-or-append rule as save(), keyed by fix ID.
+        """
+        fixes = list(fixes)
+        if not fixes:
+            return fixes
+        records = self._read_db()
+        index = {f.get("id"): i for i, f in enumerate(records)}
+        for fix in fixes:
+            existing_idx = index.get(fix.id)
+            if existing_idx is not None:
+                records[existing_idx] = fix.to_dict()
+            else:
+                index[fix.id] = len(records)
+                records.append(fix.to_dict())
+
+        self._write_db(records)
+        for fix in fixes:
+            self._write_markdown(fix)
+        return fixes
+
     def get(self, fix_id: str) -> Optional[Fix]:
         """Retrieve a fix by ID """
         fixes = self._read_db()
@@ -84,14 +108,65 @@ class FixRepository:
         """Return all fixes in the database."""
         return [Fix.from_dict(f) for f in self._read_db()]
 
+    def iter_all(self) -> Iterator[Fix]:
+        """Yield every fix in the database, building each one on demand."""
+        for data in self._read_db():
+            yield Fix.from_dict(data)
+
     def search(self, query: str) -> list[Fix]:
         """Search fixes by query string (case-insensitive)."""
-        return [f for f in self.list_all() if f.matches(query)]
+        return list(self.iter_matching(query))
+
+    def iter_matching(self, query: str, match_any: bool = False) -> Iterator[Fix]:
+        """Yield fixes matching query, with the same rule as Fix.matches.
+
+        The query is split once and tested against the raw records, so only
+        matching fixes are built into Fix objects.
+        """
+        words = query.lower().split()
+        if not words:
+            return
+        for data in self._read_db():
+            if words_match(words, [data.get(f) for f in SEARCH_FIELDS], match_any):
+                yield Fix.from_dict(data)
 
     def find_by_resource_type(self, resource_type: str) -> list[Fix]:
         """Find all fixes tagged with a specific resource type."""
         return [f for f in self.list_all() if f.matches_resource_type(resource_type)]
 
+    def find_by_resource_types(
+        self, resource_types: list[str]
+    ) -> Iterator[tuple[str, Fix]]:
+        """Yield (resource_type, fix) pairs for fixes tagged with any of the types.
+
+        Reads the database once for the whole batch instead of once per type,
+        and lowercases each fix's tags once rather than once per type (same
+        match as Fix.matches_resource_type). Pairs are grouped by resource
+        type, in the order given.
+        """
+        tagged = [(f.tags.lower(), f) for f in self.list_all() if f.tags]
+        for resource_type in resource_types:
+            needle = resource_type.lower()
+            for tags, fix in tagged:
+                if needle in tags:
+                    yield resource_type, fix
+
+    def find_by_addresses(self, addresses: Iterable[str]) -> Iterator[Fix]:
+        """Yield fixes whose issue or error excerpt mentions any of the addresses.
+
+        Matching is a case-insensitive substring test. It runs on the raw
+        records with one combined pattern, so only matching fixes are built
+        into Fix objects.
+        """
+        needles = {a.lower() for a in addresses}
+        if not needles:
+            return
+        pattern = re.compile("|".join(map(re.escape, needles)))
+        for data in self._read_db():
+            text = " ".join(filter(None, [data.get("issue"), data.get("error_excerpt")]))
+            if pattern.search(text.lower()):
+                yield Fix.from_dict(data)
+
     def delete(self, fix_id: str) -> bool:
         """Delete a fix by ID. Returns True if deleted."""
         fixes = self._read_db()
@@ -108,6 +183,27 @@ class FixRepository:
                 return True
         return False
 
+    def delete_many(self, fix_ids: Iterable[str]) -> int:
+        """Delete fixes by full ID, rewriting the database once.
+
+        Returns the number of fixes deleted.
+        """
+        targets = set(fix_ids)
+        if not targets:
+            return 0
+        kept, removed = [], []
+        for f in self._read_db():
+            (removed if f["id"] in targets else kept).append(f)
+        if not removed:
+            return 0
+        self._write_db(kept)
+
+        for f in removed:
+            md_path = self.docs_path / f"{f['id']}.md"
+            if md_path.exists():
+                md_path.unlink()
+        return len(removed)
+
     def count(self) -> int:
         """Return the number of fixes in the database."""
         return len(self._read_db())
@@ -9,6 +9,7 @@ import click
 
 from .config import SuggestionWeights
 from .models import Fix
+from .parsers.base import ParsedError
 from .storage import FixRepository
 
 
@@ -34,6 +35,7 @@ def find_similar_fixes(
     min_score: int = 15,
     resource_address: Optional[str] = None,
     error_id: Optional[str] = None,
+    fixes: Optional[list[Fix]] = None,
 ) -> list[Fix]:
     """
     Find fixes similar to the given error text and tags.
@@ -47,8 +49,10 @@ def find_similar_fixes(
         min_score: Minimum score threshold for results.
         resource_address: Parsed resource address (e.g. aws_instance.web).
         error_id: Error ID to boost fixes captured for this exact error.
+        fixes: The repository's fixes, already loaded. Lets callers looking
+            up several errors read the database once instead of per call.
     """
-    all_fixes = repo.list_all()
+    all_fixes = fixes if fixes is not None else repo.list_all()
     if not all_fixes:
         return []
 
@@ -205,11 +209,22 @@ def prompt_similar_fixes(
     error_text: str,
     tags: Optional[str] = None,
     limit: int = 5,
+    parsed_error: Optional[ParsedError] = None,
 ) -> Optional[Fix]:
     """
     Find similar fixes and prompt user to select one or create new.
+
+    When the caller already parsed the error, pass it as ``parsed_error`` so
+    its resource address and error ID feed the search directly.
     """
-    similar = find_similar_fixes(repo, error_text, tags, limit=limit)
+    if parsed_error is not None:
+        similar = find_similar_fixes(
+            repo, error_text, tags, limit=limit,
+            resource_address=parsed_error.resource_address,
+            error_id=parsed_error.error_id,
+        )
+    else:
+        similar = find_similar_fixes(repo, error_text, tags, limit=limit)
 
     if not similar:
         return None
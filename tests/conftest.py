@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_fixdoc_home(tmp_path, monkeypatch):
+    """Point FIXDOC_HOME at a temp dir so CLI runs never share ~/.fixdoc state."""
+    monkeypatch.setenv("FIXDOC_HOME", str(tmp_path / "fixdoc-home"))
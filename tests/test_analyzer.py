@@ -1,8 +1,14 @@
 """Tests for fixdoc terraform analyzer."""
 
+import importlib
 import json
+import os
+import subprocess
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
 
 from fixdoc.models import Fix
 from fixdoc.storage import FixRepository
@@ -78,6 +84,15 @@ class TestTerraformAnalyzer:
         assert "resource_changes" in plan
         assert len(plan["resource_changes"]) == 2
 
+    def test_load_plan_without_orjson(self, sample_plan, temp_repo, monkeypatch):
+        """load_plan falls back to stdlib json when orjson is unavailable."""
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        monkeypatch.setattr(analyze_mod, "orjson", None)
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+        plan = analyzer.load_plan(sample_plan)
+
+        assert len(plan["resource_changes"]) == 2
+
     def test_extract_resource_types(self, sample_plan, temp_repo):
         analyzer = TerraformAnalyzer(repo=temp_repo)
         plan = analyzer.load_plan(sample_plan)
@@ -87,6 +102,45 @@ class TestTerraformAnalyzer:
         assert ("azurerm_storage_account.main", "azurerm_storage_account") in resources
         assert ("azurerm_key_vault.main", "azurerm_key_vault") in resources
 
+    def test_extract_resource_types_dedups_planned_values(self, temp_repo):
+        """planned_values entries already in resource_changes are not repeated."""
+        plan = {
+            "resource_changes": [
+                {"address": "aws_vpc.main", "type": "aws_vpc", "change": {"actions": ["create"]}},
+            ],
+            "planned_values": {
+                "root_module": {
+                    "resources": [{"address": "aws_vpc.main", "type": "aws_vpc"}],
+                    "child_modules": [{
+                        "address": "module.db",
+                        "resources": [{"address": "module.db.aws_db_instance.this", "type": "aws_db_instance"}],
+                    }],
+                },
+            },
+        }
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        assert analyzer.extract_resource_types(plan) == [
+            ("aws_vpc.main", "aws_vpc"),
+            ("module.db.aws_db_instance.this", "aws_db_instance"),
+        ]
+        assert analyzer.extract_resource_types(plan) == [
+            (r.address, r.resource_type) for r in analyzer.extract_resources(plan)
+        ]
+
+    def test_extract_resources_module_path(self, temp_repo):
+        """Nested module segments keep their instance keys, even dotted ones."""
+        plan = {"resource_changes": [
+            {"address": 'module.net[0].module.sg["a.b"].aws_sg.web', "type": "aws_sg",
+             "change": {"actions": ["create"]}},
+            {"address": "aws_vpc.module", "type": "aws_vpc", "change": {"actions": ["create"]}},
+        ]}
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        assert [r.module_path for r in analyzer.extract_resources(plan)] == [
+            'module.net[0].module.sg["a.b"]', None,
+        ]
+
     def test_get_changed_resources_filters_no_ops(self, mixed_plan, temp_repo):
         """get_changed_resources should only return resources with actual changes."""
         analyzer = TerraformAnalyzer(repo=temp_repo)
@@ -97,6 +151,47 @@ class TestTerraformAnalyzer:
         assert changed[0].address == "azurerm_storage_account.main"
         assert changed[0].action == "create"
 
+    def test_iter_resource_changes(self, sample_plan, temp_repo):
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+        addresses = [c["address"] for c in analyzer.iter_resource_changes(sample_plan)]
+
+        assert addresses == ["azurerm_storage_account.main", "azurerm_key_vault.main"]
+
+    def test_iter_resource_changes_without_ijson(self, sample_plan, temp_repo, monkeypatch):
+        """iter_resource_changes falls back to a full parse without ijson."""
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        monkeypatch.setattr(analyze_mod, "ijson", None)
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        assert len(list(analyzer.iter_resource_changes(sample_plan))) == 2
+
+    def test_truncated_plan_raises_json_decode_error(self, sample_plan, temp_repo):
+        sample_plan.write_text(sample_plan.read_text()[:60])
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        with pytest.raises(json.JSONDecodeError):
+            analyzer.analyze(sample_plan)
+        with pytest.raises(json.JSONDecodeError):
+            analyzer.get_plan_summary(sample_plan)
+
+    def test_get_changed_resources_from_file(self, mixed_plan, temp_repo):
+        """Streaming path matches get_changed_resources on the parsed plan."""
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+        streamed = analyzer.get_changed_resources_from_file(mixed_plan)
+        parsed = analyzer.get_changed_resources(analyzer.load_plan(mixed_plan))
+
+        assert [r.address for r in streamed] == [r.address for r in parsed]
+
+    def test_get_plan_summary(self, mixed_plan, temp_repo):
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        assert analyzer.get_plan_summary(mixed_plan) == {
+            "total": 1,
+            "by_provider": {"azure": 1},
+            "by_action": {"create": 1},
+            "by_type": {"azurerm_storage_account": 1},
+        }
+
     def test_analyze_no_matches(self, sample_plan, temp_repo):
         analyzer = TerraformAnalyzer(repo=temp_repo)
         matches = analyzer.analyze(sample_plan)
@@ -118,6 +213,28 @@ class TestTerraformAnalyzer:
         assert matches[0].resource_type == "azurerm_storage_account"
         assert matches[0].related_fix.id == fix.id
 
+    def test_analyze_batches_type_lookups(self, tmp_path, temp_repo, monkeypatch):
+        plan = {"resource_changes": [
+            {"address": f"aws_iam_role.r{i}", "type": "aws_iam_role",
+             "change": {"actions": ["update"]}}
+            for i in range(3)
+        ] + [{"address": "aws_vpc.main", "type": "aws_vpc", "change": {"actions": ["create"]}}]}
+        plan_path = tmp_path / "roles.json"
+        plan_path.write_text(json.dumps(plan))
+        temp_repo.save(Fix(issue="Role issue", resolution="Fixed", tags="aws_iam_role"))
+        calls = []
+        lookup = temp_repo.find_by_resource_types
+        monkeypatch.setattr(
+            temp_repo, "find_by_resource_types", lambda rts: calls.append(rts) or lookup(rts)
+        )
+
+        matches = TerraformAnalyzer(repo=temp_repo).analyze(plan_path)
+
+        assert [m.resource_address for m in matches] == [
+            "aws_iam_role.r0", "aws_iam_role.r1", "aws_iam_role.r2",
+        ]
+        assert calls == [["aws_iam_role", "aws_vpc"]]
+
     def test_analyze_multiple_matches(self, sample_plan, temp_repo):
         fix1 = Fix(
             issue="Storage issue",
@@ -173,6 +290,15 @@ class TestTerraformAnalyzer:
         assert "Storage access denied" in output
         assert "Added contributor role" in output
 
+    def test_analyze_plan_dict_matches_file(self, sample_plan, temp_repo):
+        temp_repo.save(Fix(issue="Storage access denied", resolution="Added role",
+                           tags="azurerm_storage_account"))
+        analyzer = TerraformAnalyzer(repo=temp_repo)
+
+        plan = json.loads(sample_plan.read_text())
+
+        assert analyzer.analyze_plan_and_format(plan) == analyzer.analyze_and_format(sample_plan)
+
     def test_replace_action_detected(self, tmp_path, temp_repo):
         """create+delete actions should be detected as replace."""
         plan = {
@@ -216,3 +342,135 @@ class TestAnalysisMatch:
         assert "FIX-" in warning
         assert "Resolution:" in warning
         assert "Tags:" in warning
+
+    def test_format_warning_truncates_long_text(self):
+        fix = Fix(issue="i" * 80, resolution="r" * 81)
+        match = AnalysisMatch(resource_address="a.b", resource_type="a", related_fix=fix)
+
+        lines = match.format_warning().splitlines()
+
+        assert lines[0].endswith(": " + "i" * 80)
+        assert lines[1].endswith(": " + "r" * 80 + "...")
+
+
+class TestTerraformGraphCache:
+    @pytest.fixture
+    def fake_terraform(self, tmp_path, monkeypatch):
+        """Run in a Terraform workdir with a fake `terraform graph` that counts calls."""
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        workdir = tmp_path / "infra"
+        workdir.mkdir()
+        (workdir / "main.tf").write_text('resource "aws_vpc" "main" {}\n')
+        monkeypatch.chdir(workdir)
+        monkeypatch.setattr(analyze_mod.shutil, "which", lambda name: "/usr/bin/terraform")
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout='"A" -> "B"\n', stderr="")
+
+        monkeypatch.setattr(analyze_mod.subprocess, "run", fake_run)
+        return analyze_mod, workdir, calls
+
+    def test_key_requires_terraform_files(self, tmp_path):
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        assert analyze_mod._terraform_graph_cache_key(tmp_path) is None
+
+    def test_key_changes_with_tf_files(self, fake_terraform):
+        analyze_mod, workdir, _ = fake_terraform
+        before = analyze_mod._terraform_graph_cache_key(workdir)
+        (workdir / "vars.tf").write_text('variable "x" {}\n')
+
+        assert analyze_mod._terraform_graph_cache_key(workdir) != before
+
+    def test_key_covers_manifest_modules_only(self, fake_terraform):
+        analyze_mod, workdir, _ = fake_terraform
+        module_dir = workdir / "modules" / "vpc"
+        module_dir.mkdir(parents=True)
+        (module_dir / "main.tf").write_text('resource "aws_subnet" "a" {}\n')
+        manifest = workdir / ".terraform" / "modules" / "modules.json"
+        manifest.parent.mkdir(parents=True)
+        manifest.write_text(json.dumps({"Modules": [
+            {"Key": "", "Source": "", "Dir": "."},
+            {"Key": "vpc", "Source": "./modules/vpc", "Dir": "modules/vpc"},
+        ]}))
+        before = analyze_mod._terraform_graph_cache_key(workdir)
+
+        # Unlisted nested and hidden trees are not read
+        (workdir / "node_modules").mkdir()
+        (workdir / "node_modules" / "x.tf").write_text("")
+        assert analyze_mod._terraform_graph_cache_key(workdir) == before
+
+        (module_dir / "vars.tf").write_text('variable "x" {}\n')
+        assert analyze_mod._terraform_graph_cache_key(workdir) != before
+
+    def test_graph_reused_until_files_change(self, fake_terraform, tmp_path):
+        analyze_mod, workdir, calls = fake_terraform
+        cache_dir = tmp_path / "cache"
+
+        assert analyze_mod._auto_run_terraform_graph(cache_dir=cache_dir) == '"A" -> "B"\n'
+        assert analyze_mod._auto_run_terraform_graph(cache_dir=cache_dir) == '"A" -> "B"\n'
+        assert len(calls) == 1
+
+        (workdir / "vars.tf").write_text('variable "x" {}\n')
+        analyze_mod._auto_run_terraform_graph(cache_dir=cache_dir)
+        assert len(calls) == 2
+
+    def test_graph_written_atomically_and_pruned(self, fake_terraform, tmp_path, monkeypatch):
+        analyze_mod, _, _ = fake_terraform
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        for i in range(3):
+            old = cache_dir / f"old{i}.dot"
+            old.write_text("stale")
+            os.utime(old, (i, i))
+        monkeypatch.setattr(analyze_mod, "_CACHE_MAX_ENTRIES", 2)
+
+        analyze_mod._auto_run_terraform_graph(cache_dir=cache_dir)
+
+        names = sorted(p.name for p in cache_dir.iterdir())
+        assert len(names) == 2 and "old2.dot" in names
+        assert not any(name.endswith(".tmp") for name in names)
+
+    def test_no_cache_dir_always_runs(self, fake_terraform):
+        analyze_mod, _, calls = fake_terraform
+        analyze_mod._auto_run_terraform_graph()
+        analyze_mod._auto_run_terraform_graph()
+        assert len(calls) == 2
+
+
+class TestAnalyzeGraphRun:
+    @pytest.mark.parametrize("plan_text", [
+        "{not json",
+        json.dumps({"resource_changes": [
+            {"address": "aws_vpc.main", "type": "aws_vpc", "change": {"actions": ["no-op"]}},
+        ]}),
+    ])
+    def test_graph_not_run_when_nothing_to_analyze(self, tmp_path, plan_text):
+        """Invalid and no-change plans exit without starting `terraform graph`."""
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        plan_file = tmp_path / "plan.json"
+        plan_file.write_text(plan_text)
+
+        with patch.object(analyze_mod, "_auto_run_terraform_graph") as mock_graph:
+            CliRunner().invoke(
+                analyze_mod.analyze, [str(plan_file)], obj={"base_path": tmp_path},
+            )
+
+        mock_graph.assert_not_called()
+
+    def test_graph_result_used(self, tmp_path):
+        analyze_mod = importlib.import_module("fixdoc.commands.analyze")
+        plan_file = tmp_path / "plan.json"
+        plan_file.write_text(json.dumps({"resource_changes": [
+            {"address": "aws_vpc.main", "type": "aws_vpc", "change": {"actions": ["create"]}},
+        ]}))
+
+        with patch.object(analyze_mod, "_auto_run_terraform_graph", return_value=None) as mock_graph:
+            result = CliRunner().invoke(
+                analyze_mod.analyze, [str(plan_file)], obj={"base_path": tmp_path},
+            )
+
+        assert result.exit_code == 0
+        mock_graph.assert_called_once()
+        assert "running without dependency graph" in result.output
@@ -0,0 +1,108 @@
+"""Tests for fixdoc capture handlers."""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+
+_ch_mod = importlib.import_module("fixdoc.commands.capture_handlers")
+
+
+def _form(**fields):
+    """Build a saved editor form from field values."""
+    return "".join(f"{key}: {value}\n" for key, value in fields.items())
+
+
+class TestParseEditorForm:
+    def test_values_are_literal_text(self):
+        fields = _ch_mod._parse_editor_form(_form(
+            issue="Error: AccessDenied on s3",
+            resolution="yes",
+            error_excerpt="2024-01-15",
+            tags="aws,s3",
+            notes="404",
+        ))
+
+        assert fields == {
+            "issue": "Error: AccessDenied on s3",
+            "resolution": "yes",
+            "error_excerpt": "2024-01-15",
+            "tags": "aws,s3",
+            "notes": "404",
+        }
+
+    def test_multi_line_values_and_comments(self):
+        text = (
+            "# comment\n"
+            "issue: Apply failed\n"
+            "resolution:\n"
+            "  no\n"
+            "error_excerpt: Error: creating bucket\n"
+            "  with aws_s3_bucket.main,\n"
+            "  on main.tf line 1: resource\n"
+            "notes:\n"
+        )
+        fields = _ch_mod._parse_editor_form(text)
+
+        assert fields["resolution"] == "no"
+        assert fields["error_excerpt"] == (
+            "Error: creating bucket\n  with aws_s3_bucket.main,\n  on main.tf line 1: resource"
+        )
+        assert fields["tags"] == ""
+        assert fields["notes"] == ""
+
+    @pytest.mark.parametrize("text", [
+        "issue: only the issue\n",
+        "stray text\nissue: x\nresolution: y\n",
+        "issue: x\nresolution: y\nissue: z\n",
+    ])
+    def test_unreadable_forms_raise(self, text):
+        with pytest.raises(ValueError):
+            _ch_mod._parse_editor_form(text)
+
+
+class TestEditorCapture:
+    """Tests for editor-mode interactive capture."""
+
+    def test_fields_read_from_one_editor_session(self):
+        edited = _form(
+            issue="Error: S3 bucket name taken",
+            resolution="Added IAM role binding",
+            error_excerpt="",
+            tags="aws,s3",
+            notes="line one",
+        ) + "line two\n"
+        with patch.object(_ch_mod.click, "edit", return_value=edited) as mock_edit, \
+             patch.object(_ch_mod.click, "prompt") as mock_prompt, \
+             patch.object(_ch_mod.click, "echo"):
+            fix = _ch_mod.handle_interactive_capture(None, None, use_editor=True)
+
+        mock_edit.assert_called_once()
+        mock_prompt.assert_not_called()
+        assert fix.issue == "Error: S3 bucket name taken"
+        assert fix.resolution == "Added IAM role binding"
+        assert fix.error_excerpt is None
+        assert fix.tags == "aws,s3"
+        assert fix.notes == "line one\nline two"
+
+    def test_unreadable_form_reopens_with_users_text(self):
+        incomplete = "issue: Error: AccessDenied\nresolution:\n"
+        fixed = "issue: Error: AccessDenied\nresolution: Added IAM role binding\n"
+        with patch.object(_ch_mod.click, "edit", side_effect=[incomplete, fixed]) as mock_edit, \
+             patch.object(_ch_mod.click, "confirm", return_value=True), \
+             patch.object(_ch_mod.click, "echo"):
+            fix = _ch_mod.handle_interactive_capture(None, None, use_editor=True)
+
+        assert mock_edit.call_args_list[1].kwargs["text"] == incomplete
+        assert fix.issue == "Error: AccessDenied"
+        assert fix.resolution == "Added IAM role binding"
+
+    def test_unsaved_or_abandoned_form_captures_nothing(self):
+        with patch.object(_ch_mod.click, "edit", return_value=None), \
+             patch.object(_ch_mod.click, "echo"):
+            assert _ch_mod.handle_interactive_capture("t", None, use_editor=True) is None
+
+        with patch.object(_ch_mod.click, "edit", return_value="issue: only\n"), \
+             patch.object(_ch_mod.click, "confirm", return_value=False), \
+             patch.object(_ch_mod.click, "echo"):
+            assert _ch_mod.handle_interactive_capture("t", None, use_editor=True) is None
@@ -2,6 +2,9 @@
 
 import importlib
 import json
+import os
+import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -30,12 +33,17 @@ from fixdoc.change_impact import (
     ScoreExplanation,
     ATTR_CATEGORIES,
     ATTR_CHECKS,
+    CONTROL_POINT_PATTERNS,
     _normalize_tf_node,
     _normalize_action,
     _history_cluster_key,
     _dedup_history_candidates,
     _extract_principals,
     _compute_iam_sensitivity,
+    _build_change_index,
+    _to_csr,
+    _parse_dot_impact_graph,
+    _plan_address_keys,
     ACTION_POINTS,
 )
 from fixdoc.cli import create_cli
@@ -137,6 +145,16 @@ class TestControlPointClassification:
         assert is_boundary_resource("aws_iam_role") is True
         assert is_boundary_resource("aws_s3_bucket") is False
 
+    def test_longest_prefix_wins_for_every_pattern(self):
+        """Each pattern (and any suffix of it) resolves to its own payload."""
+        for prefix, payload in CONTROL_POINT_PATTERNS.items():
+            assert classify_control_point(prefix) == payload
+            assert classify_control_point(prefix + "_extra") == payload
+
+    def test_partial_prefix_is_not_a_match(self):
+        assert classify_control_point("aws_iam") is None
+        assert classify_control_point("") is None
+
 
 # ===================================================================
 # TestNormalizeAction
@@ -219,11 +237,44 @@ class TestDotParser:
         assert "provider.aws" in fwd.get("aws_iam_role.app", set())
         assert "aws_iam_role.app" in fwd.get("aws_lambda_function.api", set())
 
+    def test_edge_with_attributes_falls_back_to_regex(self):
+        dot = '"[root] A" -> "[root] B" [label="dep"]'
+        fwd, _ = parse_dot_graph(dot)
+        assert fwd["A"] == {"B"}
+
+    def test_trailing_semicolon(self):
+        dot = '"A" -> "B";'
+        fwd, _ = parse_dot_graph(dot)
+        assert fwd["A"] == {"B"}
+
+    def test_impact_graph_is_reverse_csr(self):
+        dot = '"A" -> "B"\n"A" -> "C"\n"A" -> "B"\n"C" -> "D"'
+        graph, forward = _parse_dot_impact_graph(dot, {"A"})
+        assert graph.names == ["A", "B", "C", "D"]
+        result = compute_affected_set(["D"], graph)
+        assert [(r.address, r.depth) for r in result] == [("C", 1), ("A", 2)]
+        assert forward == {"A": ["B", "C"]}
+
+    def test_impact_graph_drops_repeated_edges(self):
+        dot = '"A" -> "B"\n"C" -> "B"\n"A" -> "B"\n"A" -> "C"\n"A" -> "C"'
+        graph, forward = _parse_dot_impact_graph(dot, {"A"})
+        b = graph.ids["B"]
+        assert [graph.names[i] for i in graph.indices[graph.indptr[b]:graph.indptr[b + 1]]] == ["A", "C"]
+        assert len(graph.indices) == 3
+        assert forward == {"A": ["B", "C"]}
+
     def test_multiple_edges_from_same_node(self):
         dot = '"A" -> "B"\n"A" -> "C"'
         fwd, _ = parse_dot_graph(dot)
         assert fwd["A"] == {"B", "C"}
 
+    def test_plan_address_keys_cover_collapsed_instances(self):
+        keys = _plan_address_keys({'aws_sg.bulk[0]', 'module.m["a"].aws_x.y[1]'})
+        assert "aws_sg.bulk" in keys
+        assert "module.m" in keys
+        assert 'module.m["a"].aws_x.y' in keys
+        assert "aws_sg" not in keys
+
 
 # ===================================================================
 # TestBFS
@@ -254,6 +305,9 @@ class TestBFS:
         assert "C" in addrs
         assert "D" not in addrs
 
+    def test_zero_depth_reports_nothing(self):
+        assert compute_affected_set(["A"], {"A": {"B"}}, max_depth=0) == []
+
     def test_cycle_safety(self):
         adj = {"A": {"B"}, "B": {"C"}, "C": {"A"}}
         result = compute_affected_set(["A"], adj, max_depth=10)
@@ -267,6 +321,29 @@ class TestBFS:
         assert "C" in addrs
         assert "D" in addrs
 
+    def test_nearest_start_wins(self):
+        adj = {"A": {"B"}, "B": {"C"}, "C": {"D"}, "X": {"D"}}
+        result = {r.address: r for r in compute_affected_set(["A", "X"], adj)}
+        assert result["D"].depth == 1
+        assert result["D"].path == ["X", "D"]
+
+    def test_paths_follow_parent_chain(self):
+        adj = {"A": {"B"}, "B": {"C"}, "C": set()}
+        result = {r.address: r.path for r in compute_affected_set(["A"], adj)}
+        assert result == {"B": ["A", "B"], "C": ["A", "B", "C"]}
+
+    def test_accepts_prebuilt_csr(self):
+        adj = {"A": {"B"}, "B": {"C"}}
+        graph = _to_csr(adj)
+        assert graph.names == ["A", "B", "C"]
+        assert list(graph.indptr) == [0, 1, 2, 2]
+        assert graph.indices.typecode == "i"
+        result = compute_affected_set(["A"], graph, max_depth=5)
+        assert [(r.address, r.depth) for r in result] == [("B", 1), ("C", 2)]
+
+    def test_start_not_in_graph(self):
+        assert compute_affected_set(["Z"], {"A": {"B"}}) == []
+
     def test_disconnected_node(self):
         adj = {"A": {"B"}, "B": set(), "X": {"Y"}, "Y": set()}
         result = compute_affected_set(["A"], adj, max_depth=5)
@@ -322,6 +399,23 @@ class TestTieredAffected:
         assert len(l1) == 1
         assert len(l2) == 1
 
+    def test_analysis_bfs_bounded_when_l2_gated(self, tmp_path):
+        """analyze_change_impact stops the BFS at depth 1 when L2 is gated off."""
+        import fixdoc.change_impact as ci_mod
+
+        plan = make_plan([
+            make_resource_change("aws_s3_bucket.data", "aws_s3_bucket", ["update"]),
+        ])
+        dot = 'digraph {\n"B" -> "aws_s3_bucket.data"\n"C" -> "B"\n}'
+
+        with patch.object(ci_mod, "_bfs_csr", wraps=ci_mod._bfs_csr) as mock_bfs:
+            result = analyze_change_impact(
+                plan, FixRepository(tmp_path), dot_text=dot, max_depth=5
+            )
+
+        assert mock_bfs.call_args.args[2] == 1
+        assert [(a["address"], a["depth"]) for a in result.affected] == [("B", 1)]
+
 
 # ===================================================================
 # TestImpactScore
@@ -543,6 +637,24 @@ class TestRedaction:
         assert result["after"]["name"] == "myapp"
         assert result["after"]["region"] == "us-west-2"
 
+    def test_nested_markers_merged_across_phases(self):
+        change = {
+            "before": {"conn": {"uri": "a", "port": 1}},
+            "after": {"conn": {"uri": "b", "port": 2}, "name": "x"},
+            "before_sensitive": {"conn": {"uri": True}},
+            "after_sensitive": {"conn": {}, "name": False},
+        }
+        result = redact_plan_values(change)
+        assert result["before"]["conn"] == {"uri": "[REDACTED]", "port": 1}
+        assert result["after"]["conn"] == {"uri": "[REDACTED]", "port": 2}
+        assert result["after"]["name"] == "x"
+
+    def test_key_match_is_case_insensitive(self):
+        change = {"after": {"Master_PASSWORD": "x"}, "before": {"master_password": "y"}}
+        result = redact_plan_values(change)
+        assert result["after"]["Master_PASSWORD"] == "[REDACTED]"
+        assert result["before"]["master_password"] == "[REDACTED]"
+
 
 # ===================================================================
 # TestHistoryPrior
@@ -626,6 +738,17 @@ class TestHistoryPrior:
         assert count == 1
         assert len(matches) == 1
 
+    def test_address_override_escapes_indexed_address(self, tmp_path):
+        """Indexed addresses match literally in error_excerpt, case-insensitively."""
+        repo = FixRepository(tmp_path)
+        node = ImpactNode("aws_instance.app[0]", "aws_instance", "update")
+        repo.save(Fix(issue="capacity", resolution="Fix", tags="aws_instance",
+                      error_excerpt="Error on AWS_INSTANCE.APP[0]: capacity"))
+        repo.save(Fix(issue="aws_instance.app0 capacity", resolution="Fix",
+                      tags="aws_instance"))
+        count, _ = compute_history_prior(["aws_instance"], [node], repo)
+        assert count == 1
+
     def test_category_tag_filter_excludes_resource_type_only_tagged_fixes(self, tmp_path):
         """Fix tagged only with resource-type (no category tag) is excluded even under gate."""
         repo = FixRepository(tmp_path)
@@ -929,6 +1052,114 @@ class TestAnalyzeCommand:
         data = json.loads(result.output)
         assert data["changes"][0]["action"] == "replace"
 
+    def test_result_cached_between_runs(self, tmp_path):
+        """An identical re-run reuses the stored result unless --no-cache is given."""
+        plan = make_plan([
+            make_resource_change("aws_iam_role.app", "aws_iam_role", ["delete"]),
+        ])
+        plan_file = self._write_plan(tmp_path, plan)
+
+        runner = CliRunner(mix_stderr=False)
+        cli = create_cli()
+        real_analyze = _analyze_cmd_mod.analyze_change_impact
+        outputs = []
+
+        with patch.object(_analyze_cmd_mod, "_auto_run_terraform_graph", return_value=None), \
+                patch.object(_analyze_cmd_mod, "analyze_change_impact",
+                             side_effect=real_analyze) as mock_analyze:
+            for extra in ([], [], ["--no-cache"]):
+                result = runner.invoke(
+                    cli,
+                    ["analyze", plan_file, "--format", "json", *extra],
+                    obj=make_obj(tmp_path),
+                )
+                assert result.exit_code == 0
+                outputs.append(json.loads(result.output))
+
+        assert mock_analyze.call_count == 2
+        assert outputs[0]["analysis_id"] != outputs[1]["analysis_id"]
+        for data in outputs:
+            del data["analysis_id"], data["timestamp"]
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_stale_cached_result_recomputed_and_removed(self, tmp_path):
+        """An entry older than the TTL is deleted and its result recomputed."""
+        plan = make_plan([
+            make_resource_change("aws_iam_role.app", "aws_iam_role", ["delete"]),
+        ])
+        plan_file = self._write_plan(tmp_path, plan)
+        # The CLI group resolves the store from FIXDOC_HOME (see conftest)
+        cache_dir = tmp_path / "fixdoc-home" / "cache" / "impact"
+        cache_dir.mkdir(parents=True)
+        stale = cache_dir / "stale.json"
+        stale.write_text("{}")
+        expired = time.time() - _analyze_cmd_mod._IMPACT_CACHE_TTL - 60
+        os.utime(stale, (expired, expired))
+
+        assert _analyze_cmd_mod._load_cached_impact(stale) is None
+        assert not stale.exists()
+
+        runner = CliRunner(mix_stderr=False)
+        cli = create_cli()
+        real_analyze = _analyze_cmd_mod.analyze_change_impact
+        args = ["analyze", plan_file, "--format", "json", "--exit-on", "low"]
+
+        with patch.object(_analyze_cmd_mod, "_auto_run_terraform_graph", return_value=None), \
+                patch.object(_analyze_cmd_mod, "analyze_change_impact",
+                             side_effect=real_analyze) as mock_analyze:
+            runner.invoke(cli, args, obj=make_obj(tmp_path))
+            (entry,) = cache_dir.iterdir()
+            # Tamper with the entry and age it past the TTL
+            entry.write_text(json.dumps({"score": 0, "severity": "low"}))
+            os.utime(entry, (expired, expired))
+            result = runner.invoke(cli, args, obj=make_obj(tmp_path))
+
+        assert mock_analyze.call_count == 2
+        assert json.loads(result.output)["severity"] != "low"
+        assert result.exit_code == 1
+        assert time.time() - entry.stat().st_mtime < 60
+
+    def test_impact_cache_pruned_to_max_entries(self, tmp_path, monkeypatch):
+        from fixdoc.change_impact import ImpactResult
+
+        cache_dir = tmp_path / "impact"
+        monkeypatch.setattr(_analyze_cmd_mod, "_CACHE_MAX_ENTRIES", 2)
+        for i, name in enumerate(["a", "b", "c"]):
+            _analyze_cmd_mod._store_cached_impact(cache_dir / f"{name}.json", ImpactResult())
+            os.utime(cache_dir / f"{name}.json", (i, i))
+        _analyze_cmd_mod._store_cached_impact(cache_dir / "d.json", ImpactResult())
+
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["c.json", "d.json"]
+
+
+    def test_new_fix_invalidates_cached_result(self, tmp_path):
+        """Capturing a fix changes the database stamp, so the result is recomputed."""
+        plan = make_plan([
+            make_resource_change("aws_iam_role.app", "aws_iam_role", ["delete"]),
+        ])
+        plan_file = self._write_plan(tmp_path, plan)
+        repo = FixRepository(tmp_path)
+
+        key_before = _analyze_cmd_mod._impact_cache_key(Path(plan_file), None, repo)
+        repo.save(Fix(issue="Role deletion broke app", resolution="Recreated",
+                      tags="aws_iam_role"))
+
+        assert _analyze_cmd_mod._impact_cache_key(Path(plan_file), None, repo) != key_before
+
+    def test_store_writes_atomically_and_surfaces_serialization_errors(self, tmp_path):
+        from fixdoc.change_impact import ImpactResult
+
+        cache_path = tmp_path / "impact" / "key.json"
+        result = ImpactResult(score=10, severity="low")
+        _analyze_cmd_mod._store_cached_impact(cache_path, result)
+
+        assert _analyze_cmd_mod._load_cached_impact(cache_path).score == 10
+        assert [p.name for p in cache_path.parent.iterdir()] == ["key.json"]
+
+        result.history_matches = [object()]
+        with pytest.raises(TypeError):
+            _analyze_cmd_mod._store_cached_impact(cache_path, result)
+
 
 # ===================================================================
 # TestExitOnFlag
@@ -1657,6 +1888,21 @@ class TestAnalyzeFormatJson:
         # id should be full (not truncated)
         assert entry["id"] == "abcdef1234567890abcd"
 
+    def test_json_compact_by_default(self):
+        from fixdoc.commands.analyze import _format_json
+        result = _make_result_with_warnings([])
+        assert "\n" not in _format_json(result)
+        pretty = _format_json(result, pretty=True)
+        assert "\n  " in pretty
+        assert json.loads(pretty) == json.loads(_format_json(result))
+
+    def test_json_without_orjson(self, monkeypatch):
+        from fixdoc.commands.analyze import _format_json
+        monkeypatch.setattr(_analyze_cmd_mod, "orjson", None)
+        result = _make_result_with_warnings([])
+        assert "\n" not in _format_json(result)
+        assert json.loads(_format_json(result, pretty=True))["severity"] == result.severity
+
 
 # ===================================================================
 # TestIAMSensitivity
@@ -1706,6 +1952,23 @@ class TestIAMSensitivity:
         assert delta == 0.0
         assert wildcard is False
 
+    def test_iam_update_sensitivity_via_change_index(self, tmp_path):
+        """analyze_change_impact looks up the IAM change block by address."""
+        before_policy = json.dumps({"Statement": [{"Principal": {"Service": "ec2.amazonaws.com"}}]})
+        after_policy = json.dumps({"Statement": [{"Principal": "*"}]})
+        rc = make_resource_change("aws_iam_role.app", "aws_iam_role", ["update"])
+        rc["change"]["before"] = {"assume_role_policy": before_policy}
+        rc["change"]["after"] = {"assume_role_policy": after_policy}
+        plan = make_plan([
+            make_resource_change("aws_s3_bucket.data", "aws_s3_bucket", ["update"]),
+            rc,
+        ])
+        assert _build_change_index(plan)["aws_iam_role.app"] is rc["change"]
+
+        repo = FixRepository(base_path=tmp_path)
+        result = analyze_change_impact(plan, repo)
+        assert result.severity in ("high", "critical")
+
     def test_wildcard_trust_forces_high_floor(self):
         """ImpactNode with wildcard_trust=True forces score >= 50 (HIGH)."""
         nodes = [ImpactNode("aws_iam_role.r", "aws_iam_role", "update",
@@ -2,6 +2,7 @@
 
 import os
 import pytest
+import yaml
 from pathlib import Path
 
 from fixdoc.config import (
@@ -40,6 +41,7 @@ class TestFixDocConfig:
         assert config.capture.error_excerpt_max_chars == 2000
         assert config.capture.max_suggestions_shown == 3
         assert config.capture.similar_fix_limit == 5
+        assert config.capture.use_editor is False
 
     def test_default_suggestion_weights(self):
         config = FixDocConfig()
@@ -127,6 +129,12 @@ class TestFixDocConfig:
         assert config.suggestion_weights.resolution_keyword_weight == 1
         assert config.suggestion_weights.resource_type_weight == 8
 
+    def test_from_dict_null_private_fixes(self):
+        """A `private_fixes:` key with no value loads as an empty list."""
+        config = FixDocConfig.from_dict({"private_fixes": None})
+
+        assert config.private_fixes == []
+
     def test_from_dict_partial_config(self):
         """Only display section present, others get defaults."""
         data = {
@@ -265,6 +273,23 @@ class TestConfigManager:
         assert manager.is_fix_private("fix-123") is True
         assert manager.is_fix_private("fix-456") is False
 
+    def test_load_reuses_parse_until_file_changes(self, tmp_path):
+        from unittest.mock import patch
+        import fixdoc.config as config_mod
+
+        manager = ConfigManager(tmp_path)
+        manager.save(FixDocConfig(private_fixes=["fix-1"]))
+
+        with patch.object(config_mod.yaml, "load", wraps=yaml.load) as mock_load:
+            first = manager.load()
+            first.private_fixes.append("not-saved")
+            second = manager.load()
+            assert mock_load.call_count == 1
+            assert second.private_fixes == ["fix-1"]
+
+            manager.add_private_fix("fix-2")
+            assert manager.load().private_fixes == ["fix-1", "fix-2"]
+
     def test_creates_directory_on_save(self, tmp_path):
         nested_path = tmp_path / "nested" / "path"
         manager = ConfigManager(nested_path)
@@ -437,7 +437,7 @@ class TestWatchIntegration:
         lines.append(b"")  # EOF sentinel
 
         mock_proc = MagicMock()
-        mock_proc.stdout.readline = MagicMock(side_effect=lines)
+        mock_proc.stdout.read1 = MagicMock(side_effect=lines)
         mock_proc.returncode = exit_code
         mock_proc.wait.return_value = exit_code
         return mock_proc
@@ -137,6 +137,15 @@ class TestFix:
 
         assert not fix.matches_resource_type("anything")
 
+    def test_tag_list_follows_edits(self):
+        fix = Fix(issue="Test", resolution="Test", tags=" rbac, ,storage,")
+
+        assert fix.tag_list == ("rbac", "storage")
+        fix.tags = "iam"
+        assert fix.tag_list == ("iam",)
+        fix.tags = None
+        assert fix.tag_list == ()
+
 
 # ===================================================================
 # TestSourceErrorIds — Feature 2
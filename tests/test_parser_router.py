@@ -123,6 +123,33 @@ class TestUnifiedParsing:
 
         assert len(errors) == 2
 
+    def test_known_source_skips_detection(self, monkeypatch):
+        import fixdoc.parsers.router as router
+
+        text = """
+        │ Error: creating S3 Bucket (bucket1)
+        │   with aws_s3_bucket.one,
+        │   on main.tf line 1
+        """
+        monkeypatch.setattr(router, "detect_error_source", lambda t: pytest.fail("re-detected"))
+
+        errors = detect_and_parse(text, source=ErrorSource.TERRAFORM)
+
+        assert isinstance(errors[0], TerraformError)
+
+
+class TestIndicatorMatching:
+    """Tests for the literal-prefiltered indicator check used by can_parse."""
+
+    def test_literal_gates_case_insensitive_pattern(self):
+        from fixdoc.parsers.base import compile_indicators, matches_any_indicator
+
+        indicators = compile_indicators([("kubectl", r"kubectl\s+apply")])
+
+        assert matches_any_indicator("$ KUBECTL  apply -f x.yaml", indicators)
+        assert not matches_any_indicator("kubectl get pods", indicators)
+        assert not matches_any_indicator("", indicators)
+
 
 class TestSingleErrorParsing:
     """Tests for parsing single errors."""
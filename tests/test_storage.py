@@ -76,6 +76,25 @@ class TestFixRepository:
         
         assert len(all_fixes) == 2
     
+    def test_iter_all_is_lazy(self, temp_repo):
+        saved = [temp_repo.save(Fix(issue=f"Issue {i}", resolution="r")) for i in range(2)]
+
+        fixes = temp_repo.iter_all()
+
+        assert not isinstance(fixes, list)
+        assert [f.id for f in fixes] == [f.id for f in saved]
+
+    def test_save_many(self, temp_repo):
+        existing = temp_repo.save(Fix(issue="Original", resolution="r"))
+        existing.issue = "Updated"
+        new = Fix(issue="New", resolution="r")
+
+        temp_repo.save_many([existing, new])
+
+        assert [f.issue for f in temp_repo.list_all()] == ["Updated", "New"]
+        assert (temp_repo.docs_path / f"{new.id}.md").exists()
+        assert temp_repo.save_many([]) == []
+
     def test_search(self, temp_repo):
         fix1 = Fix(issue="Storage account error", resolution="Added role")
         fix2 = Fix(issue="Key vault issue", resolution="Updated policy")
@@ -96,6 +115,18 @@ class TestFixRepository:
         
         assert len(results) == 1
     
+    def test_iter_matching(self, temp_repo):
+        storage = temp_repo.save(Fix(issue="Storage account error", resolution="Added role"))
+        vault = temp_repo.save(Fix(issue="Key vault issue", resolution="Updated policy",
+                                   notes="role assignment"))
+
+        assert [f.id for f in temp_repo.iter_matching("stor role")] == [storage.id]
+        assert [f.id for f in temp_repo.iter_matching("ROLE")] == [storage.id, vault.id]
+        assert [f.id for f in temp_repo.iter_matching("vault storage", match_any=True)] == [
+            storage.id, vault.id,
+        ]
+        assert list(temp_repo.iter_matching("  ")) == []
+
     def test_find_by_resource_type(self, temp_repo):
         fix1 = Fix(
             issue="Storage error",
@@ -116,6 +147,31 @@ class TestFixRepository:
         assert len(results) == 1
         assert "storage" in results[0].issue.lower()
     
+    def test_find_by_resource_types(self, temp_repo):
+        storage = temp_repo.save(Fix(issue="Storage", resolution="Fixed", tags="azurerm_storage_account"))
+        vault = temp_repo.save(Fix(issue="Vault", resolution="Fixed", tags="azurerm_key_vault"))
+        temp_repo.save(Fix(issue="Untagged", resolution="Fixed"))
+
+        pairs = list(temp_repo.find_by_resource_types(
+            ["azurerm_key_vault", "azurerm_storage_account", "aws_s3_bucket"]
+        ))
+
+        assert [(rt, f.id) for rt, f in pairs] == [
+            ("azurerm_key_vault", vault.id),
+            ("azurerm_storage_account", storage.id),
+        ]
+
+    def test_find_by_addresses(self, temp_repo):
+        by_issue = temp_repo.save(Fix(issue="aws_sg.web[0] rule conflict", resolution="Fixed"))
+        by_excerpt = temp_repo.save(Fix(issue="SG error", resolution="Fixed",
+                                        error_excerpt="Error: AWS_SG.WEB[0] failed"))
+        temp_repo.save(Fix(issue="aws_sg.web0 unrelated", resolution="Fixed"))
+
+        found = [f.id for f in temp_repo.find_by_addresses({"aws_sg.web[0]"})]
+
+        assert found == [by_issue.id, by_excerpt.id]
+        assert list(temp_repo.find_by_addresses(set())) == []
+
     def test_delete(self, temp_repo):
         fix = Fix(issue="Test", resolution="Test")
         saved = temp_repo.save(fix)
@@ -128,6 +184,17 @@ class TestFixRepository:
         assert temp_repo.count() == 0
         assert not (temp_repo.docs_path / f"{saved.id}.md").exists()
     
+    def test_delete_many(self, temp_repo):
+        keep = temp_repo.save(Fix(issue="Keep", resolution="r"))
+        drop = [temp_repo.save(Fix(issue=f"Drop {i}", resolution="r")) for i in range(2)]
+
+        removed = temp_repo.delete_many([f.id for f in drop] + ["nonexistent"])
+
+        assert removed == 2
+        assert [f.id for f in temp_repo.list_all()] == [keep.id]
+        assert not any((temp_repo.docs_path / f"{f.id}.md").exists() for f in drop)
+        assert temp_repo.delete_many([]) == 0
+
     def test_delete_not_found(self, temp_repo):
         result = temp_repo.delete("nonexistent")
         assert result is False
@@ -406,6 +406,38 @@ class TestErrorIdMatch:
         results = find_similar_fixes(repo, "AccessDenied")
         # No crash is the assertion
 
+    def test_preloaded_fixes_skip_repo_read(self, repo_with_fixes):
+        from unittest.mock import patch
+
+        fixes = repo_with_fixes.list_all()
+        expected = find_similar_fixes(repo_with_fixes, "BucketAlreadyExists")
+        with patch.object(repo_with_fixes, "list_all") as mock_list:
+            found = find_similar_fixes(repo_with_fixes, "BucketAlreadyExists", fixes=fixes)
+
+        mock_list.assert_not_called()
+        assert [f.id for f in found] == [f.id for f in expected]
+
+    def test_prompt_forwards_parsed_error(self, tmp_path):
+        from unittest.mock import patch
+        from fixdoc.parsers.base import ParsedError
+        from fixdoc.storage import FixRepository
+        from fixdoc import suggestions
+
+        err = ParsedError(
+            error_type="terraform",
+            error_message="AccessDenied",
+            raw_output="Error: AccessDenied",
+            resource_address="aws_iam_role.app",
+        )
+        with patch.object(suggestions, "find_similar_fixes", return_value=[]) as mock_fsf:
+            suggestions.prompt_similar_fixes(
+                FixRepository(tmp_path), err.raw_output, parsed_error=err,
+            )
+
+        kwargs = mock_fsf.call_args.kwargs
+        assert kwargs["resource_address"] == "aws_iam_role.app"
+        assert kwargs["error_id"] == err.error_id
+
 
 # ===================================================================
 # TestEffectivenessBoost
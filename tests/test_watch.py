@@ -30,7 +30,7 @@ def mock_popen_success(stdout_lines=None):
         stdout_lines = [b""]
     mock_proc = MagicMock()
     mock_proc.returncode = 0
-    mock_proc.stdout.readline.side_effect = stdout_lines
+    mock_proc.stdout.read1.side_effect = stdout_lines
     mock_proc.wait.return_value = 0
     return mock_proc
 
@@ -41,7 +41,7 @@ def mock_popen_failure(exit_code=1, stdout_lines=None):
         stdout_lines = [b"Error: something went wrong\n", b""]
     mock_proc = MagicMock()
     mock_proc.returncode = exit_code
-    mock_proc.stdout.readline.side_effect = stdout_lines
+    mock_proc.stdout.read1.side_effect = stdout_lines
     mock_proc.wait.return_value = exit_code
     return mock_proc
 
@@ -221,6 +221,48 @@ class TestWatchCommandFailure:
         assert "I'll ask what fixed these" in result.output
         store_instance.save.assert_called_once()
 
+    def test_invalid_choice_reprompts(self, tmp_path):
+        """A typo at the [c]/[s] prompt asks again instead of silently skipping."""
+        runner = CliRunner()
+        cli = create_cli()
+
+        with patch.object(_watch_mod.subprocess, "Popen") as mp, \
+             patch.object(_watch_mod, "detect_and_parse") as mock_parse, \
+             patch.object(_watch_mod, "PendingStore"), \
+             patch.object(_watch_mod, "_capture_error_for_watch", return_value=None) as mock_cap:
+            mp.return_value = mock_popen_failure()
+            mock_parse.return_value = [_make_parsed_error()]
+
+            result = runner.invoke(
+                cli,
+                ["watch", "--", "failing-cmd"],
+                obj=make_obj(tmp_path),
+                input="x\nc\n9\n1\n",
+            )
+
+        assert "is not one of" in result.output
+        assert "(c, s)" not in result.output
+        assert "is not in the range" in result.output
+        mock_cap.assert_called_once()
+
+    def test_captured_output_keeps_bounded_tail(self, tmp_path):
+        """Long output is trimmed from the front on line boundaries; the tail is parsed."""
+        runner = CliRunner()
+        cli = create_cli()
+        lines = [f"line {i:03d}\n".encode() for i in range(200)] + [b"Error: last\n", b""]
+
+        with patch.object(_watch_mod, "_CAPTURE_TAIL_BYTES", 100), \
+             patch.object(_watch_mod.subprocess, "Popen") as mp, \
+             patch.object(_watch_mod, "detect_and_parse", return_value=[]) as mock_parse, \
+             patch.object(_watch_mod, "PendingStore"):
+            mp.return_value = mock_popen_failure(stdout_lines=lines)
+            runner.invoke(cli, ["watch", "--", "failing-cmd"], obj=make_obj(tmp_path))
+
+        parsed = mock_parse.call_args.args[0]
+        assert parsed.endswith("Error: last")
+        assert parsed.startswith("line ")
+        assert len(parsed) <= 200
+
     def test_single_error_auto_defers_stores_entry(self, tmp_path):
         """Auto-defer saves a PendingEntry for the structured error."""
         runner = CliRunner()
@@ -922,9 +964,9 @@ class TestWatchApplyCancelled:
             mp.return_value = mock_popen_failure(
                 stdout_lines=list(cancelled_output.split(b"\n")[:-1]) + [b""],
             )
-            # Make each line end with \n for readline simulation
+            # Make each line end with \n; each read1 call returns one line
             lines = [line + b"\n" for line in cancelled_output.split(b"\n") if line] + [b""]
-            mp.return_value.stdout.readline.side_effect = lines
+            mp.return_value.stdout.read1.side_effect = lines
             store_instance = MockStore.return_value
 
             result = runner.invoke(